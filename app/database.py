@@ -2,6 +2,7 @@ import os
 import logging
 import sqlite3
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy.pool import StaticPool
 
 # Initialize with default database URL
 # This will be overridden during app startup based on environment
@@ -32,7 +33,15 @@ def init_database_engine():
             database_url = 'sqlite:///./gdial.db'
     
     # Handle SQLite threading issues
-    if database_url.startswith('sqlite://'):
+    if database_url.startswith('sqlite:///:memory:'):
+        # A single shared connection keeps the in-memory database alive across sessions and threads
+        engine = create_engine(
+            database_url,
+            echo=False,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+    elif database_url.startswith('sqlite://'):
         engine = create_engine(database_url, echo=False, connect_args={"check_same_thread": False})
     else:
         engine = create_engine(database_url, echo=False)
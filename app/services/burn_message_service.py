@@ -6,7 +6,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple, Dict, Any
 
-from sqlmodel import Session, select
+from sqlmodel import Session, delete, select
 from fastapi import HTTPException
 
 from app.config import get_settings
@@ -145,20 +145,15 @@ class BurnMessageService:
         Returns:
             Number of messages deleted
         """
-        # Get all expired or viewed messages
+        # Delete all expired or viewed messages in a single statement
         current_time = datetime.now()
-        expired_messages = self.session.exec(
-            select(BurnMessage).where(
+        result = self.session.exec(
+            delete(BurnMessage).where(
                 (BurnMessage.expires_at < current_time) | 
                 (BurnMessage.viewed == True)
             )
-        ).all()
-        
-        # Delete them
-        count = 0
-        for message in expired_messages:
-            self.session.delete(message)
-            count += 1
+        )
+        count = result.rowcount
             
         self.session.commit()
         logger.info(f"Deleted {count} expired or viewed burn messages")
@@ -6,13 +6,17 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 import pytest
+from unittest.mock import Mock
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlmodel import Session
 
 # Set test environment file before any imports
 os.environ.setdefault('ENV_FILE', '.env.test')
 
 from app.main import app
 from app.database_package import get_session
+from app.api.crisis_management import get_crisis_management_service
 
 # Import comprehensive database test fixtures
 from tests.fixtures.database_test_fixtures import (
@@ -24,8 +28,42 @@ from tests.fixtures.database_test_fixtures import (
 )
 
 # Import other fixtures
-from tests.fixtures.twilio_mocks import mock_twilio_client
-from tests.fixtures.tts_mocks import mock_openai_client
+from tests.fixtures.twilio_mocks import mock_twilio_client, reset_twilio_client_mocks
+from tests.fixtures.tts_mocks import mock_openai_client, reset_openai_client_mocks
+
+
+@pytest.fixture(scope="session")
+def mock_session():
+    """Create a mock database session shared across the test session."""
+    return Mock(spec=Session)
+
+
+@pytest.fixture(scope="session")
+def shared_crisis_service():
+    """Create one mock CrisisManagementService shared across the test session."""
+    service = Mock()
+    service.session = Mock()
+    return service
+
+
+@pytest.fixture
+def mock_crisis_service(shared_crisis_service):
+    """Inject the shared mock CrisisManagementService into the crisis API for one test."""
+    app.dependency_overrides[get_crisis_management_service] = lambda: shared_crisis_service
+    yield shared_crisis_service
+    app.dependency_overrides.pop(get_crisis_management_service, None)
+
+
+# Shared mock fixtures that must start every test from a clean slate
+_SHARED_MOCK_FIXTURES = ("mock_session", "mock_crisis_service")
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_mocks(request):
+    """Reset the shared mocks before each test that uses them."""
+    for name in _SHARED_MOCK_FIXTURES:
+        if name in request.fixturenames:
+            request.getfixturevalue(name).reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture(scope="function")
@@ -40,13 +78,30 @@ def populated_session(populated_test_session):
     return populated_test_session
 
 
+@pytest.fixture(scope="session")
+def api_client():
+    """Create a single TestClient shared by the whole test session.
+
+    Server errors come back as 500 responses instead of being re-raised, and
+    redirects are not followed, so every assertion sees the route's own response.
+    """
+    return TestClient(app, raise_server_exceptions=False, follow_redirects=False)
+
+
 @pytest.fixture(scope="function")
-def client(test_db_manager):
+def client(api_client, test_db_manager):
     """Create a test client with overridden database session using the shared engine."""
     # Override the get_session dependency to use our test database manager
     app.dependency_overrides[get_session] = get_test_session_override(test_db_manager)
     
-    client = TestClient(app)
-    yield client
+    yield api_client
     
-    app.dependency_overrides.clear()
+    app.dependency_overrides.pop(get_session, None)
+    api_client.cookies.clear()
+
+
+@pytest.fixture
+async def async_client():
+    """Create an async HTTP client that calls the app in-process for concurrent requests."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
@@ -6,7 +6,9 @@ from .twilio_mocks import (
     mock_twilio_message,
     mock_twilio_exception,
     failing_twilio_client,
+    reset_twilio_client_mocks,
     MockTwilioClient,
+    MockFailingTwilioClient,
     MockTwilioCall,
     MockTwilioMessage
 )
@@ -14,6 +16,7 @@ from .twilio_mocks import (
 from .tts_mocks import (
     mock_openai_client,
     failing_openai_client,
+    reset_openai_client_mocks,
     temp_audio_dir,
     mock_audio_file,
     mock_tts_settings,
@@ -29,12 +32,15 @@ __all__ = [
     'mock_twilio_message',
     'mock_twilio_exception',
     'failing_twilio_client',
+    'reset_twilio_client_mocks',
     'MockTwilioClient',
+    'MockFailingTwilioClient',
     'MockTwilioCall',
     'MockTwilioMessage',
     # TTS mocks
     'mock_openai_client',
     'failing_openai_client',
+    'reset_openai_client_mocks',
     'temp_audio_dir',
     'mock_audio_file',
     'mock_tts_settings',
@@ -0,0 +1,99 @@
+"""
+Delad testdata och hjälpfunktioner för Crisis Management API-tester
+"""
+import itertools
+import json
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from app.models import CrisisLevel
+from app.schemas.crisis_management import CrisisActivationResponse, CrisisDashboardData
+
+
+# Deterministiska UUID:er som genereras en gång i stället för uuid4() i varje test
+_UUID_POOL = [uuid.UUID(int=i) for i in range(1, 33)]
+_uuid_cycle = itertools.cycle(_UUID_POOL)
+
+
+def next_uuid():
+    """Hämta nästa UUID ur den förgenererade poolen"""
+    return next(_uuid_cycle)
+
+
+# Oföränderliga payloads som byggs en gång per process; kopiera innan de ändras
+ACTIVATE_PAYLOAD = {
+    "crisis_name": "Test Kris",
+    "crisis_type": "test",
+    "crisis_level": "emergency",
+    "geographic_area": "Test Region",
+    "primary_message": "Test meddelande",
+    "urgency_level": 4,
+    "use_voice_calls": True,
+    "use_sms": True,
+    "use_interactive_links": True,
+    "max_escalation_time_minutes": 15
+}
+
+# Saknar crisis_type, crisis_level, etc.
+INVALID_ACTIVATION_MISSING_FIELDS = {"crisis_name": "Test"}
+
+INVALID_ACTIVATION_VALUES = {
+    "crisis_name": "Test",
+    "crisis_type": "test",
+    "crisis_level": "invalid_level",  # Ogiltigt enum-värde
+    "geographic_area": "Test",
+    "primary_message": "Test",
+    "urgency_level": 10  # Utanför gränser (1-5)
+}
+
+INVALID_PERSONNEL_UPDATE = {
+    "response_status": "invalid_status",  # Ogiltigt status
+    "estimated_arrival": "not-a-datetime"  # Ogiltigt datetime-format
+}
+
+# Förserialiserade request-kroppar för payloads som postas via API:t
+JSON_HEADERS = {"Content-Type": "application/json"}
+ACTIVATE_JSON = json.dumps(ACTIVATE_PAYLOAD).encode()
+INVALID_ACTIVATION_VALUES_JSON = json.dumps(INVALID_ACTIVATION_VALUES).encode()
+INVALID_PERSONNEL_UPDATE_JSON = json.dumps(INVALID_PERSONNEL_UPDATE).encode()
+
+
+def fake_crisis(**overrides):
+    """Skapa en lättviktig krisaktivering för mockade serviceanrop"""
+    fields = {
+        "id": next_uuid(),
+        "crisis_name": "Test Kris",
+        "crisis_type": "test",
+        "crisis_level": CrisisLevel.EMERGENCY,
+        "geographic_area": "Test Region",
+        "activated_at": datetime.now(),
+        "activated_by_user_id": next_uuid(),
+        "is_active": True,
+        "resolved_at": None,
+        "primary_message": "Test meddelande",
+        "urgency_level": 4,
+        "expected_duration": None,
+        "meeting_location": None,
+        "required_arrival_time": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def chained_query(**results):
+    """Skapa en mockad query där filter/order_by/offset/limit returnerar samma query"""
+    query = Mock()
+    for method in ("filter", "order_by", "offset", "limit"):
+        getattr(query, method).return_value = query
+    for method, value in results.items():
+        getattr(query, method).return_value = value
+    return query
+
+
+# Riktig dashboard-modell som byggs en gång och returneras av den mockade tjänsten
+DASHBOARD = CrisisDashboardData(
+    crisis=CrisisActivationResponse(**vars(fake_crisis())),
+    statistics={"total_personnel": 10, "confirmed": 5}
+)
@@ -4,156 +4,280 @@ Test fixtures för krishantering och beredskap
 import pytest
 import uuid
 from datetime import datetime, timedelta
+from sqlalchemy import update
 from sqlmodel import Session
 from typing import List, Dict
 
 from app.models import (
     CrisisActivation, PersonnelActivation, ManualEscalation, CrisisTemplate,
-    Contact, PhoneNumber, ContactGroup, User, InteractiveMessage,
+    Contact, PhoneNumber, ContactGroup, User,
     CrisisLevel, PersonnelRole
 )
 
 
-@pytest.fixture
-def sample_user(test_session: Session) -> User:
+# Förberäknade UUID:n så att strängparsning bara sker en gång per process
+_USER_ID = uuid.UUID("550e8400-e29b-41d4-a716-446655440010")
+_CONTACT_IDS = tuple(
+    uuid.UUID(f"550e8400-e29b-41d4-a716-4466554400{h:02x}") for h in (0x20, 0x22, 0x24, 0x26, 0x28)
+)
+_PHONE_IDS = tuple(
+    uuid.UUID(f"550e8400-e29b-41d4-a716-4466554400{h:02x}") for h in (0x21, 0x23, 0x25, 0x27)
+)
+_GROUP_ID = uuid.UUID("550e8400-e29b-41d4-a716-446655440030")
+_TEMPLATE_ID = uuid.UUID("550e8400-e29b-41d4-a716-446655440040")
+_CRISIS_ID = uuid.UUID("550e8400-e29b-41d4-a716-446655440050")
+_ACTIVATION_IDS = tuple(
+    uuid.UUID(f"550e8400-e29b-41d4-a716-44665544006{i}") for i in range(5)
+)
+_ESCALATION_ID = uuid.UUID("550e8400-e29b-41d4-a716-446655440070")
+
+_ONE_HOUR = timedelta(hours=1)
+_THIRTY_MIN = timedelta(minutes=30)
+
+# Krismallens JSON-kolumner lagras som färdigserialiserade strängar
+_REQUIRED_ROLES_JSON = '["crisis_leader", "deputy_leader", "operations_chief", "logistics_chief"]'
+_PRIORITY_MATRIX_JSON = '{"crisis_leader": 1, "deputy_leader": 1, "operations_chief": 2, "logistics_chief": 3}'
+
+# Förberäknade svar för mockade kommunikationstjänster, slås upp per telefonnummer
+_CALL_NO_ANSWER = {"answered": False, "dtmf_digit": None, "confirmed": False}
+_CALL_RESPONSES = {
+    "+46701234567": {"answered": True, "dtmf_digit": "1", "confirmed": True},  # Krisledare
+    "+46701234568": {"answered": True, "dtmf_digit": "2", "confirmed": False},  # Ställföreträdare
+}
+_SMS_FAILED = {"delivered": False, "error": "Invalid number"}
+_SMS_RESPONSES = {
+    number: {"delivered": True, "message_sid": f"SM{number[-4:]}"}
+    for number in ("+46701234567", "+46701234568")
+}
+
+# Telefonnummer för de fyra första beredskapskontakterna, insatta utan ORM-objekt
+_PHONE_ROWS = tuple(
+    {"id": phone_id, "contact_id": contact_id, "number": number, "priority": 1}
+    for phone_id, contact_id, number in zip(
+        _PHONE_IDS,
+        _CONTACT_IDS,
+        ("+46701234567", "+46701234568", "+46701234569", "+46701234570")
+    )
+)
+
+
+@pytest.fixture(scope="session")
+def sample_user(session_test_session: Session) -> User:
     """Skapa testanvändare för krishantering"""
     user = User(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440010"),
+        id=_USER_ID,
         username="crisis_admin",
         email="crisis@example.com",
         hashed_password="hashed_password",
         disabled=False
     )
-    test_session.add(user)
-    test_session.commit()
-    test_session.refresh(user)
+    session_test_session.add(user)
+    session_test_session.commit()
+    # Koppla loss objektet så att tester aldrig startar transaktioner i den delade sessionen
+    session_test_session.expunge(user)
     return user
 
 
-@pytest.fixture
-def emergency_contacts(test_session: Session) -> List[Contact]:
-    """Skapa testpersonal för beredskap"""
-    contacts = []
-    
-    # Krisledare
-    crisis_leader = Contact(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440020"),
-        name="Anna Krisledare",
-        email="anna.krisledare@region.se",
-        notes="Krisledare för Region Väst"
-    )
-    test_session.add(crisis_leader)
-    
-    # Lägg till telefonnummer
-    phone1 = PhoneNumber(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440021"),
-        contact_id=crisis_leader.id,
-        number="+46701234567",
-        priority=1
-    )
-    test_session.add(phone1)
-    contacts.append(crisis_leader)
-    
-    # Ställföreträdare
-    deputy_leader = Contact(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440022"),
-        name="Björn Ställföreträdare",
-        email="bjorn.deputy@region.se",
-        notes="Ställföreträdande krisledare"
-    )
-    test_session.add(deputy_leader)
-    
-    phone2 = PhoneNumber(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440023"),
-        contact_id=deputy_leader.id,
-        number="+46701234568",
-        priority=1
-    )
-    test_session.add(phone2)
-    contacts.append(deputy_leader)
-    
-    # Operativ chef
-    operations_chief = Contact(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440024"),
-        name="Cecilia Operativ",
-        email="cecilia.ops@region.se",
-        notes="Operativ chef"
+def _build_emergency_contacts() -> List[Contact]:
+    """Bygg testpersonal för beredskap utan att spara dem"""
+    return [
+        # Krisledare
+        Contact(
+            id=_CONTACT_IDS[0],
+            name="Anna Krisledare",
+            email="anna.krisledare@region.se",
+            notes="Krisledare för Region Väst"
+        ),
+        # Ställföreträdare
+        Contact(
+            id=_CONTACT_IDS[1],
+            name="Björn Ställföreträdare",
+            email="bjorn.deputy@region.se",
+            notes="Ställföreträdande krisledare"
+        ),
+        # Operativ chef
+        Contact(
+            id=_CONTACT_IDS[2],
+            name="Cecilia Operativ",
+            email="cecilia.ops@region.se",
+            notes="Operativ chef"
+        ),
+        # Informationsansvarig
+        Contact(
+            id=_CONTACT_IDS[3],
+            name="David Information",
+            email="david.info@region.se",
+            notes="Informationsansvarig"
+        ),
+        # Kontakt utan telefonnummer (för testning av eskalering)
+        Contact(
+            id=_CONTACT_IDS[4],
+            name="Erik Inget Telefon",
+            email="erik.nophone@region.se",
+            notes="Kontakt utan telefonnummer"
+        ),
+    ]
+
+
+def _build_crisis_activation(user_id: uuid.UUID, now: datetime) -> CrisisActivation:
+    """Bygg testkrisaktiveringen utan att spara den"""
+    return CrisisActivation(
+        id=_CRISIS_ID,
+        crisis_name="Översvämning Göta Älv",
+        crisis_type="översvämning",
+        crisis_level=CrisisLevel.EMERGENCY,
+        geographic_area="Västra Götaland",
+        activated_at=now,
+        activated_by_user_id=user_id,
+        expected_duration="24 timmar",
+        meeting_location="Regionens kriscentrum, Göteborg",
+        required_arrival_time=now + _ONE_HOUR,
+        is_active=True,
+        primary_message="Kritisk översvämningssituation vid Göta Älv. Vattennivåerna stiger snabbt och evakuering kan bli nödvändig.",
+        urgency_level=4
     )
-    test_session.add(operations_chief)
+
+
+def _build_personnel_activations(
+    crisis_id: uuid.UUID,
+    contacts: List[Contact],
+    now: datetime
+) -> List[PersonnelActivation]:
+    """Bygg personalaktiveringar för testkrisen utan att spara dem"""
+    arrival = now + _ONE_HOUR
     
-    phone3 = PhoneNumber(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440025"),
-        contact_id=operations_chief.id,
-        number="+46701234569",
-        priority=1
-    )
-    test_session.add(phone3)
-    contacts.append(operations_chief)
+    roles = [
+        PersonnelRole.CRISIS_LEADER,
+        PersonnelRole.DEPUTY_LEADER,
+        PersonnelRole.OPERATIONS_CHIEF,
+        PersonnelRole.INFORMATION_OFFICER
+    ]
+    role_priorities = {PersonnelRole.CRISIS_LEADER: 1, PersonnelRole.DEPUTY_LEADER: 1}
     
-    # Informationsansvarig
-    info_officer = Contact(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440026"),
-        name="David Information",
-        email="david.info@region.se",
-        notes="Informationsansvarig"
-    )
-    test_session.add(info_officer)
+    activations = [
+        PersonnelActivation(
+            id=_ACTIVATION_IDS[i],
+            crisis_id=crisis_id,
+            contact_id=contact.id,
+            assigned_role=role,
+            priority_level=role_priorities.get(role, 2),
+            meeting_location="Regionens kriscentrum, Göteborg",
+            required_arrival_time=arrival,
+            response_status="pending"
+        )
+        for i, (contact, role) in enumerate(zip(contacts[:4], roles))
+    ]
     
-    phone4 = PhoneNumber(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440027"),
-        contact_id=info_officer.id,
-        number="+46701234570",
-        priority=1
-    )
-    test_session.add(phone4)
-    contacts.append(info_officer)
+    # Skapa en aktivering för kontakt utan telefon (för eskaleringstest)
+    activations.append(PersonnelActivation(
+        id=_ACTIVATION_IDS[4],
+        crisis_id=crisis_id,
+        contact_id=contacts[4].id,  # Kontakt utan telefon
+        assigned_role=PersonnelRole.SUPPORT_STAFF,
+        priority_level=3,
+        response_status="pending"
+    ))
     
-    # Kontakt utan telefonnummer (för testning av eskalering)
-    no_phone_contact = Contact(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440028"),
-        name="Erik Inget Telefon",
-        email="erik.nophone@region.se",
-        notes="Kontakt utan telefonnummer"
+    return activations
+
+
+def _confirmed_activation_values(now: datetime) -> Dict:
+    """Fältvärden för en bekräftad personalaktivering"""
+    return {
+        "call_attempted_at": now - timedelta(minutes=5),
+        "call_answered": True,
+        "call_confirmed": True,
+        "response_status": "confirmed",
+        "response_received_at": now - timedelta(minutes=4),
+        "estimated_arrival": now + _THIRTY_MIN
+    }
+
+
+def _declined_activation_values(now: datetime) -> Dict:
+    """Fältvärden för en avböjd personalaktivering"""
+    return {
+        "sms_sent_at": now - timedelta(minutes=3),
+        "sms_confirmed": True,
+        "response_status": "declined",
+        "response_received_at": now - timedelta(minutes=2),
+        "availability_comment": "Är på semester utomlands"
+    }
+
+
+def _escalated_activation_values(now: datetime) -> Dict:
+    """Fältvärden för en eskalerad personalaktivering"""
+    return {
+        "call_attempted_at": now - timedelta(minutes=10),
+        "call_answered": False,
+        "sms_sent_at": now - timedelta(minutes=8),
+        "sms_confirmed": False,
+        "interactive_link_sent": True,
+        "interactive_response_received": False,
+        "escalated_to_manual": True,
+        "escalated_at": now - timedelta(minutes=2)
+    }
+
+
+def _build_manual_escalation(
+    crisis_id: uuid.UUID,
+    personnel_activation_id: uuid.UUID,
+    now: datetime
+) -> ManualEscalation:
+    """Bygg manuell eskalering utan att spara den"""
+    return ManualEscalation(
+        id=_ESCALATION_ID,
+        crisis_id=crisis_id,
+        personnel_activation_id=personnel_activation_id,
+        escalated_at=now - timedelta(minutes=2),
+        escalation_reason="no_answer",
+        attempts_made=3,
+        assigned_to_operator="Telefonist Anna",
+        operator_assigned_at=now - timedelta(minutes=1),
+        contact_successful=False
     )
-    test_session.add(no_phone_contact)
-    contacts.append(no_phone_contact)
-    
-    test_session.commit()
-    
-    # Refresh alla kontakter för att få relationships
+
+
+@pytest.fixture(scope="session")
+def emergency_contacts(session_test_session: Session) -> List[Contact]:
+    """Skapa testpersonal för beredskap"""
+    contacts = _build_emergency_contacts()
+    session_test_session.add_all(contacts)
+    # Kontakterna måste finnas innan telefonnumren kan referera till dem
+    session_test_session.flush()
+    session_test_session.bulk_insert_mappings(PhoneNumber, _PHONE_ROWS)
+    session_test_session.commit()
     for contact in contacts:
-        test_session.refresh(contact)
-    
+        session_test_session.expunge(contact)
     return contacts
 
 
-@pytest.fixture
-def emergency_group(test_session: Session, emergency_contacts: List[Contact]) -> ContactGroup:
+@pytest.fixture(scope="session")
+def emergency_group(session_test_session: Session) -> ContactGroup:
     """Skapa beredskapsgrupp"""
     group = ContactGroup(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440030"),
+        id=_GROUP_ID,
         name="Krisledningsgrupp Väst",
         description="Huvudgrupp för krishantering i Västra Götaland"
     )
-    test_session.add(group)
-    test_session.commit()
-    test_session.refresh(group)
+    session_test_session.add(group)
+    session_test_session.commit()
+    session_test_session.expunge(group)
     return group
 
 
-@pytest.fixture
-def crisis_template(test_session: Session, sample_user: User) -> CrisisTemplate:
+@pytest.fixture(scope="session")
+def crisis_template(session_test_session: Session, sample_user: User) -> CrisisTemplate:
     """Skapa krismall för översvämning"""
     template = CrisisTemplate(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440040"),
+        id=_TEMPLATE_ID,
         template_name="Översvämning Standard",
         crisis_type="översvämning",
         default_crisis_level=CrisisLevel.EMERGENCY,
         call_message_template="Kritisk översvämningssituation. {role} behövs omgående. Tryck 1 för att bekräfta.",
         sms_message_template="🚨 Översvämning: {role} behövs. Svara JA för bekräftelse.",
         interactive_message_template="**ÖVERSVÄMNINGSKRIS**\n\n{message}\n\n**Din roll:** {role}",
-        required_roles='["crisis_leader", "deputy_leader", "operations_chief", "logistics_chief"]',
-        priority_matrix='{"crisis_leader": 1, "deputy_leader": 1, "operations_chief": 2, "logistics_chief": 3}',
+        required_roles=_REQUIRED_ROLES_JSON,
+        priority_matrix=_PRIORITY_MATRIX_JSON,
         max_call_attempts=3,
         call_timeout_seconds=30,
         confirmation_deadline_minutes=15,
@@ -161,30 +285,18 @@ def crisis_template(test_session: Session, sample_user: User) -> CrisisTemplate:
         created_by_user_id=sample_user.id,
         is_active=True
     )
-    test_session.add(template)
-    test_session.commit()
-    test_session.refresh(template)
+    session_test_session.add(template)
+    session_test_session.commit()
+    # Ladda relationen innan objektet kopplas loss från den delade sessionen
+    session_test_session.refresh(template, ["created_by"])
+    session_test_session.expunge_all()
     return template
 
 
 @pytest.fixture
 def sample_crisis_activation(test_session: Session, sample_user: User) -> CrisisActivation:
     """Skapa testkrisaktivering"""
-    crisis = CrisisActivation(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440050"),
-        crisis_name="Översvämning Göta Älv",
-        crisis_type="översvämning",
-        crisis_level=CrisisLevel.EMERGENCY,
-        geographic_area="Västra Götaland",
-        activated_at=datetime.now(),
-        activated_by_user_id=sample_user.id,
-        expected_duration="24 timmar",
-        meeting_location="Regionens kriscentrum, Göteborg",
-        required_arrival_time=datetime.now() + timedelta(hours=1),
-        is_active=True,
-        primary_message="Kritisk översvämningssituation vid Göta Älv. Vattennivåerna stiger snabbt och evakuering kan bli nödvändig.",
-        urgency_level=4
-    )
+    crisis = _build_crisis_activation(sample_user.id, datetime.now())
     test_session.add(crisis)
     test_session.commit()
     test_session.refresh(crisis)
@@ -198,46 +310,12 @@ def personnel_activations(
     emergency_contacts: List[Contact]
 ) -> List[PersonnelActivation]:
     """Skapa personalaktiveringar för testkris"""
-    activations = []
-    
-    roles = [
-        PersonnelRole.CRISIS_LEADER,
-        PersonnelRole.DEPUTY_LEADER,
-        PersonnelRole.OPERATIONS_CHIEF,
-        PersonnelRole.INFORMATION_OFFICER
-    ]
-    
-    for i, (contact, role) in enumerate(zip(emergency_contacts[:4], roles)):
-        activation = PersonnelActivation(
-            id=uuid.UUID(f"550e8400-e29b-41d4-a716-44665544006{i}"),
-            crisis_id=sample_crisis_activation.id,
-            contact_id=contact.id,
-            assigned_role=role,
-            priority_level=1 if role in [PersonnelRole.CRISIS_LEADER, PersonnelRole.DEPUTY_LEADER] else 2,
-            meeting_location="Regionens kriscentrum, Göteborg",
-            required_arrival_time=datetime.now() + timedelta(hours=1),
-            response_status="pending"
-        )
-        test_session.add(activation)
-        activations.append(activation)
-    
-    # Skapa en aktivering för kontakt utan telefon (för eskaleringstest)
-    no_phone_activation = PersonnelActivation(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440064"),
-        crisis_id=sample_crisis_activation.id,
-        contact_id=emergency_contacts[4].id,  # Kontakt utan telefon
-        assigned_role=PersonnelRole.SUPPORT_STAFF,
-        priority_level=3,
-        response_status="pending"
+    activations = _build_personnel_activations(
+        sample_crisis_activation.id, emergency_contacts, datetime.now()
     )
-    test_session.add(no_phone_activation)
-    activations.append(no_phone_activation)
-    
+    test_session.add_all(activations)
     test_session.commit()
     
-    for activation in activations:
-        test_session.refresh(activation)
-    
     return activations
 
 
@@ -248,15 +326,12 @@ def confirmed_personnel_activation(
 ) -> PersonnelActivation:
     """Skapa bekräftad personalaktivering"""
     activation = personnel_activations[0]  # Krisledare
-    activation.call_attempted_at = datetime.now() - timedelta(minutes=5)
-    activation.call_answered = True
-    activation.call_confirmed = True
-    activation.response_status = "confirmed"
-    activation.response_received_at = datetime.now() - timedelta(minutes=4)
-    activation.estimated_arrival = datetime.now() + timedelta(minutes=30)
-    
+    test_session.execute(
+        update(PersonnelActivation)
+        .where(PersonnelActivation.id == activation.id)
+        .values(**_confirmed_activation_values(datetime.now()))
+    )
     test_session.commit()
-    test_session.refresh(activation)
     return activation
 
 
@@ -267,14 +342,12 @@ def declined_personnel_activation(
 ) -> PersonnelActivation:
     """Skapa avböjd personalaktivering"""
     activation = personnel_activations[1]  # Ställföreträdare
-    activation.sms_sent_at = datetime.now() - timedelta(minutes=3)
-    activation.sms_confirmed = True
-    activation.response_status = "declined"
-    activation.response_received_at = datetime.now() - timedelta(minutes=2)
-    activation.availability_comment = "Är på semester utomlands"
-    
+    test_session.execute(
+        update(PersonnelActivation)
+        .where(PersonnelActivation.id == activation.id)
+        .values(**_declined_activation_values(datetime.now()))
+    )
     test_session.commit()
-    test_session.refresh(activation)
     return activation
 
 
@@ -285,17 +358,12 @@ def escalated_personnel_activation(
 ) -> PersonnelActivation:
     """Skapa eskalerad personalaktivering"""
     activation = personnel_activations[2]  # Operativ chef
-    activation.call_attempted_at = datetime.now() - timedelta(minutes=10)
-    activation.call_answered = False
-    activation.sms_sent_at = datetime.now() - timedelta(minutes=8)
-    activation.sms_confirmed = False
-    activation.interactive_link_sent = True
-    activation.interactive_response_received = False
-    activation.escalated_to_manual = True
-    activation.escalated_at = datetime.now() - timedelta(minutes=2)
-    
+    test_session.execute(
+        update(PersonnelActivation)
+        .where(PersonnelActivation.id == activation.id)
+        .values(**_escalated_activation_values(datetime.now()))
+    )
     test_session.commit()
-    test_session.refresh(activation)
     return activation
 
 
@@ -306,16 +374,8 @@ def manual_escalation(
     escalated_personnel_activation: PersonnelActivation
 ) -> ManualEscalation:
     """Skapa manuell eskalering"""
-    escalation = ManualEscalation(
-        id=uuid.UUID("550e8400-e29b-41d4-a716-446655440070"),
-        crisis_id=sample_crisis_activation.id,
-        personnel_activation_id=escalated_personnel_activation.id,
-        escalated_at=datetime.now() - timedelta(minutes=2),
-        escalation_reason="no_answer",
-        attempts_made=3,
-        assigned_to_operator="Telefonist Anna",
-        operator_assigned_at=datetime.now() - timedelta(minutes=1),
-        contact_successful=False
+    escalation = _build_manual_escalation(
+        sample_crisis_activation.id, escalated_personnel_activation.id, datetime.now()
     )
     test_session.add(escalation)
     test_session.commit()
@@ -329,67 +389,73 @@ def resolved_manual_escalation(
     manual_escalation: ManualEscalation
 ) -> ManualEscalation:
     """Skapa löst manuell eskalering"""
-    manual_escalation.contact_attempted_at = datetime.now() - timedelta(minutes=5)
-    manual_escalation.contact_successful = True
-    manual_escalation.contact_result = "confirmed"
-    manual_escalation.contact_notes = "Kontaktad via hemtelefon. Bekräftar deltagande."
-    manual_escalation.resolved_at = datetime.now() - timedelta(minutes=3)
-    
+    now = datetime.now()
+    test_session.execute(
+        update(ManualEscalation)
+        .where(ManualEscalation.id == manual_escalation.id)
+        .values(
+            contact_attempted_at=now - timedelta(minutes=5),
+            contact_successful=True,
+            contact_result="confirmed",
+            contact_notes="Kontaktad via hemtelefon. Bekräftar deltagande.",
+            resolved_at=now - timedelta(minutes=3)
+        )
+    )
     test_session.commit()
-    test_session.refresh(manual_escalation)
     return manual_escalation
 
 
 @pytest.fixture
-def crisis_test_data(
+def crisis_test_data_fast(
     test_session: Session,
     sample_user: User,
     emergency_contacts: List[Contact],
     emergency_group: ContactGroup,
-    crisis_template: CrisisTemplate,
-    sample_crisis_activation: CrisisActivation,
-    personnel_activations: List[PersonnelActivation],
-    confirmed_personnel_activation: PersonnelActivation,
-    declined_personnel_activation: PersonnelActivation,
-    escalated_personnel_activation: PersonnelActivation,
-    manual_escalation: ManualEscalation
+    crisis_template: CrisisTemplate
 ) -> Dict:
-    """Komplett testdataset för krishantering"""
+    """Komplett testdataset för krishantering, byggt och sparat i en enda commit"""
+    now = datetime.now()
+    crisis = _build_crisis_activation(sample_user.id, now)
+    activations = _build_personnel_activations(crisis.id, emergency_contacts, now)
+    
+    confirmed, declined, escalated = activations[:3]
+    confirmed.sqlmodel_update(_confirmed_activation_values(now))
+    declined.sqlmodel_update(_declined_activation_values(now))
+    escalated.sqlmodel_update(_escalated_activation_values(now))
+    
+    escalation = _build_manual_escalation(crisis.id, escalated.id, now)
+    
+    # Kontakterna finns redan i sessionsfixturen; krisen före barnen
+    test_session.add_all([crisis, *activations, escalation])
+    test_session.commit()
+    
     return {
         "user": sample_user,
         "contacts": emergency_contacts,
         "group": emergency_group,
         "template": crisis_template,
-        "crisis": sample_crisis_activation,
-        "activations": personnel_activations,
-        "confirmed_activation": confirmed_personnel_activation,
-        "declined_activation": declined_personnel_activation,
-        "escalated_activation": escalated_personnel_activation,
-        "escalation": manual_escalation,
+        "crisis": crisis,
+        "activations": activations,
+        "confirmed_activation": confirmed,
+        "declined_activation": declined,
+        "escalated_activation": escalated,
+        "escalation": escalation,
         "session": test_session
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_communication_services():
-    """Mock för kommunikationstjänster"""
+    """Mock för kommunikationstjänster (tillståndslösa, delas över hela testsessionen)"""
     class MockCallService:
         async def make_call_with_dtmf(self, phone_number: str, message: str, dtmf_responses: dict):
             # Simulera framgångsrikt samtal för vissa nummer
-            if phone_number == "+46701234567":  # Krisledare
-                return {"answered": True, "dtmf_digit": "1", "confirmed": True}
-            elif phone_number == "+46701234568":  # Ställföreträdare
-                return {"answered": True, "dtmf_digit": "2", "confirmed": False}
-            else:
-                return {"answered": False, "dtmf_digit": None, "confirmed": False}
+            return _CALL_RESPONSES.get(phone_number, _CALL_NO_ANSWER)
     
     class MockSmsService:
         async def send_sms(self, phone_number: str, message: str):
             # Simulera framgångsrik SMS för vissa nummer
-            if phone_number in ["+46701234567", "+46701234568"]:
-                return {"delivered": True, "message_sid": f"SM{phone_number[-4:]}"}
-            else:
-                return {"delivered": False, "error": "Invalid number"}
+            return _SMS_RESPONSES.get(phone_number, _SMS_FAILED)
     
     class MockInteractiveService:
         async def create_interactive_message(self, data):
@@ -3,11 +3,19 @@ Database fixtures for comprehensive test database setup.
 
 This module provides robust database fixtures that ensure all models are properly
 registered and tables are created consistently across all tests.
+
+It is also the shared base for database_test_fixtures: the SQLite pragma listener,
+the cached schema DDL and the sample data live here, while that module adds the
+TestDatabaseManager-backed fixtures used by conftest and the API client.
 """
 import pytest
+from typing import Dict
 from sqlmodel import SQLModel, Session, create_engine
 from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 import sqlite3
 
 # Import all models to ensure they're registered with SQLModel metadata
@@ -24,47 +32,131 @@ from app.config.settings_models import (
 )
 
 
-@event.listens_for(Engine, "connect")
+# Tests never need crash safety; skip fsync and the on-disk rollback journal
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON;"
+    "PRAGMA synchronous=OFF;"
+    "PRAGMA journal_mode=MEMORY;"
+    "PRAGMA temp_store=MEMORY;"
+)
+
+
 def set_sqlite_pragma(dbapi_connection, connection_record):
-    """Enable foreign key constraints for SQLite."""
+    """Enable foreign key constraints and disable durability for SQLite test databases."""
     if isinstance(dbapi_connection, sqlite3.Connection):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+        dbapi_connection.executescript(_SQLITE_PRAGMAS)
 
 
-@pytest.fixture(scope="function")
-def test_engine():
-    """Create a test database engine with in-memory SQLite."""
+def install_sqlite_pragma_listener():
+    """Register set_sqlite_pragma on all engines, at most once per process."""
+    if not event.contains(Engine, "connect", set_sqlite_pragma):
+        event.listen(Engine, "connect", set_sqlite_pragma)
+
+
+install_sqlite_pragma_listener()
+
+
+# Compiled CREATE TABLE/INDEX scripts, built once per process and keyed by checkfirst
+_DDL_CACHE: Dict[bool, str] = {}
+
+
+def _get_schema_ddl(checkfirst: bool) -> str:
+    """Compile the SQLModel schema to a SQLite DDL script on first use and cache it."""
+    if checkfirst not in _DDL_CACHE:
+        dialect = sqlite.dialect()
+        statements = []
+        for table in SQLModel.metadata.sorted_tables:
+            statements.append(str(CreateTable(table, if_not_exists=checkfirst).compile(dialect=dialect)).strip())
+            for index in table.indexes:
+                statements.append(str(CreateIndex(index, if_not_exists=checkfirst).compile(dialect=dialect)).strip())
+        _DDL_CACHE[checkfirst] = ";\n".join(statements) + ";"
+    return _DDL_CACHE[checkfirst]
+
+
+def create_all_tables(engine: Engine, checkfirst: bool = True) -> None:
+    """Create all tables by replaying the cached DDL as a single SQLite script.
+    
+    Pass checkfirst=False for a database known to be empty to skip the
+    existence checks entirely.
+    """
+    if engine.dialect.name != "sqlite":
+        SQLModel.metadata.create_all(engine, checkfirst=checkfirst)
+        return
+
+    raw_connection = engine.raw_connection()
+    try:
+        raw_connection.driver_connection.executescript(_get_schema_ddl(checkfirst))
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
+
+
+def clear_all_tables(engine: Engine) -> None:
+    """Delete every row, children before parents, leaving the schema in place."""
+    delete_script = "".join(
+        f'DELETE FROM "{table.name}";' for table in reversed(SQLModel.metadata.sorted_tables)
+    )
+    raw_connection = engine.raw_connection()
+    try:
+        raw_connection.driver_connection.executescript(delete_script)
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
+
+
+@pytest.fixture(scope="session")
+def session_test_engine():
+    """Create a session-wide in-memory engine with all tables created once."""
     engine = create_engine(
         "sqlite:///:memory:",
-        echo=False,  # Set to True for SQL debugging
-        connect_args={"check_same_thread": False}
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
     )
-    return engine
+    create_all_tables(engine, checkfirst=False)
+    yield engine
+    engine.dispose()
 
 
-@pytest.fixture(scope="function")
-def test_session(test_engine):
-    """Create a test database session with all tables created."""
-    # Create all tables from SQLModel metadata
-    SQLModel.metadata.create_all(test_engine)
-    
-    with Session(test_engine) as session:
+@pytest.fixture(scope="session")
+def session_test_connection(session_test_engine):
+    """Hold one connection and outer transaction open for the whole test session."""
+    connection = session_test_engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def session_test_session(session_test_connection):
+    """Session for session-scoped fixtures, running outside the per-test SAVEPOINT.
+
+    Commits only release a SAVEPOINT, so the data stays visible to every test
+    through the shared outer transaction.
+    """
+    with Session(
+        bind=session_test_connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False
+    ) as session:
         yield session
-        # Cleanup happens automatically when session closes
 
 
 @pytest.fixture(scope="function")
-def clean_test_session(test_engine):
-    """Create a clean test session that recreates tables for each test."""
-    # Drop all tables first
-    SQLModel.metadata.drop_all(test_engine)
-    # Create all tables fresh
-    SQLModel.metadata.create_all(test_engine)
+def test_session(session_test_connection):
+    """Create a test database session isolated by a SAVEPOINT rolled back after each test."""
+    savepoint = session_test_connection.begin_nested()
     
-    with Session(test_engine) as session:
+    with Session(
+        bind=session_test_connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False
+    ) as session:
         yield session
+    
+    if savepoint.is_active:
+        savepoint.rollback()
 
 
 def create_test_database_with_tables():
@@ -72,7 +164,8 @@ def create_test_database_with_tables():
     engine = create_engine(
         "sqlite:///:memory:",
         echo=False,
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
     )
     
     # Ensure all models are imported and registered
@@ -81,21 +174,31 @@ def create_test_database_with_tables():
     from app.config import settings_models
     
     # Create all tables
-    SQLModel.metadata.create_all(engine)
+    create_all_tables(engine, checkfirst=False)
     
     return engine
 
 
 @pytest.fixture(scope="function")
-def populated_test_session(test_session):
-    """Create a test session with some sample data."""
+def clean_test_session():
+    """Create a clean test session on a freshly created database for each test."""
+    engine = create_test_database_with_tables()
+    
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+    
+    engine.dispose()
+
+
+def add_sample_data(session: Session) -> None:
+    """Add and commit the shared sample user, contact, phone number, group and message."""
     # Create sample user
     user = User(
         id="550e8400-e29b-41d4-a716-446655440000",
         username="testuser",
         email="test@example.com"
     )
-    test_session.add(user)
+    session.add(user)
     
     # Create sample contact
     contact = Contact(
@@ -103,7 +206,7 @@ def populated_test_session(test_session):
         name="Test Contact",
         active=True
     )
-    test_session.add(contact)
+    session.add(contact)
     
     # Create sample phone number
     phone = PhoneNumber(
@@ -112,7 +215,7 @@ def populated_test_session(test_session):
         contact_id=contact.id,
         active=True
     )
-    test_session.add(phone)
+    session.add(phone)
     
     # Create sample group
     group = ContactGroup(
@@ -120,7 +223,7 @@ def populated_test_session(test_session):
         name="Test Group",
         active=True
     )
-    test_session.add(group)
+    session.add(group)
     
     # Create sample message
     message = Message(
@@ -129,7 +232,6 @@ def populated_test_session(test_session):
         content="Hello, this is a test message!",
         active=True
     )
-    test_session.add(message)
+    session.add(message)
     
-    test_session.commit()
-    yield test_session
+    session.commit()
@@ -5,24 +5,19 @@ This module provides a robust solution to the database table creation issue by e
 that both the FastAPI TestClient and test sessions use the same SQLite engine instance.
 """
 import pytest
-from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy import event
-from sqlalchemy.engine import Engine
-import sqlite3
+from sqlmodel import Session
 from contextlib import contextmanager
 
+from tests.fixtures.database_fixtures import (
+    add_sample_data, clear_all_tables, create_all_tables, install_sqlite_pragma_listener
+)
+
 # Import all models to ensure SQLModel metadata is complete
-from app.models import *
-from app.config.settings_models import *
+import app.models  # noqa: F401
+import app.config.settings_models  # noqa: F401
 
 
-@event.listens_for(Engine, "connect")
-def set_sqlite_pragma(dbapi_connection, connection_record):
-    """Enable foreign key constraints for SQLite."""
-    if isinstance(dbapi_connection, sqlite3.Connection):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+install_sqlite_pragma_listener()
 
 
 class TestDatabaseManager:
@@ -30,7 +25,6 @@ class TestDatabaseManager:
     
     def __init__(self):
         self.engine = None
-        self._session_count = 0
     
     def create_engine(self):
         """Create a test database engine with all tables."""
@@ -41,7 +35,7 @@ class TestDatabaseManager:
             os.environ.setdefault('ENVIRONMENT', 'testing')
             
             # Initialize database engine with test configuration
-            from app.database import init_database_engine, create_db_and_tables
+            from app.database import init_database_engine
             
             # Initialize the engine
             self.engine = init_database_engine()
@@ -50,8 +44,8 @@ class TestDatabaseManager:
             import app.models
             import app.config.settings_models
             
-            # Create all tables from SQLModel metadata
-            create_db_and_tables()
+            # Create all tables on this engine from the cached schema snapshot
+            create_all_tables(self.engine)
         
         return self.engine
     
@@ -61,19 +55,19 @@ class TestDatabaseManager:
         if self.engine is None:
             self.create_engine()
         
-        with Session(self.engine) as session:
-            self._session_count += 1
-            try:
-                yield session
-            finally:
-                self._session_count -= 1
+        with Session(self.engine, expire_on_commit=False) as session:
+            yield session
+    
+    def clear_tables(self):
+        """Empty all tables while keeping the engine and schema for the next test."""
+        if self.engine is not None:
+            clear_all_tables(self.engine)
     
     def reset(self):
         """Reset the database manager."""
         if self.engine:
             self.engine.dispose()
         self.engine = None
-        self._session_count = 0
 
 
 # Global test database manager instance
@@ -82,10 +76,13 @@ _test_db_manager = TestDatabaseManager()
 
 @pytest.fixture(scope="function")
 def test_db_manager():
-    """Provide the test database manager."""
-    _test_db_manager.reset()
+    """Provide the test database manager, reusing its engine across the session.
+    
+    The engine and schema are created lazily on first use; each test only
+    empties the tables afterwards instead of rebuilding the database.
+    """
     yield _test_db_manager
-    _test_db_manager.reset()
+    _test_db_manager.clear_tables()
 
 
 @pytest.fixture(scope="function")
@@ -105,49 +102,7 @@ def test_session(test_db_manager):
 def populated_test_session(test_db_manager):
     """Create a test session with sample data."""
     with test_db_manager.get_session() as session:
-        # Create sample user
-        user = User(
-            id="550e8400-e29b-41d4-a716-446655440000",
-            username="testuser",
-            email="test@example.com"
-        )
-        session.add(user)
-        
-        # Create sample contact
-        contact = Contact(
-            id="550e8400-e29b-41d4-a716-446655440001",
-            name="Test Contact",
-            active=True
-        )
-        session.add(contact)
-        
-        # Create sample phone number
-        phone = PhoneNumber(
-            id="550e8400-e29b-41d4-a716-446655440002",
-            number="+1234567890",
-            contact_id=contact.id,
-            active=True
-        )
-        session.add(phone)
-        
-        # Create sample group
-        group = ContactGroup(
-            id="550e8400-e29b-41d4-a716-446655440003",
-            name="Test Group",
-            active=True
-        )
-        session.add(group)
-        
-        # Create sample message
-        message = Message(
-            id="550e8400-e29b-41d4-a716-446655440004",
-            name="Test Message",
-            content="Hello, this is a test message!",
-            active=True
-        )
-        session.add(message)
-        
-        session.commit()
+        add_sample_data(session)
         yield session
 
 
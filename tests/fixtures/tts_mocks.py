@@ -5,7 +5,6 @@ This module provides reusable TTS and OpenAI client mocks that can be used acros
 to ensure consistent behavior and reduce test failures.
 """
 import pytest
-from unittest.mock import Mock, MagicMock
 from pathlib import Path
 
 
@@ -21,59 +20,115 @@ class MockOpenAIResponse:
             f.write(self.content)
 
 
+class MockSpeech:
+    """Lightweight stand-in for ``client.audio.speech`` that records create() calls."""
+    
+    __slots__ = ("return_value", "side_effect", "calls")
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Forget recorded calls and configured behavior."""
+        self.return_value = None
+        self.side_effect = None
+        self.calls = []
+    
+    def create(self, **kwargs):
+        """Record the call and return the configured response or raise the configured error."""
+        self.calls.append(kwargs)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+class MockAudio:
+    """Lightweight stand-in for ``client.audio``."""
+    
+    __slots__ = ("speech",)
+    
+    def __init__(self):
+        self.speech = MockSpeech()
+
+
 class MockOpenAIClient:
     """Mock OpenAI client for TTS testing."""
     
+    __slots__ = ("audio",)
+    
     def __init__(self):
-        self.audio = Mock()
-        self.speech = Mock()
+        self.audio = MockAudio()
         self._setup_audio_mock()
     
     def _setup_audio_mock(self):
         """Setup audio mock with realistic behavior."""
         # Mock successful TTS generation
-        mock_response = MockOpenAIResponse()
-        self.audio.speech.create.return_value = mock_response
+        self.audio.speech.return_value = MockOpenAIResponse()
+    
+    def reset(self):
+        """Reset recorded calls and configuration back to the default behavior."""
+        self.audio.speech.reset()
+        self._setup_audio_mock()
 
 
 class MockFailingOpenAIClient:
     """Mock OpenAI client that simulates failures."""
     
+    __slots__ = ("audio",)
+    
     def __init__(self):
-        self.audio = Mock()
-        self.speech = Mock()
+        self.audio = MockAudio()
         self._setup_failing_audio_mock()
     
     def _setup_failing_audio_mock(self):
         """Setup audio mock that fails."""
         # Simulate API key error
         from openai import AuthenticationError
-        self.audio.speech.create.side_effect = AuthenticationError("Invalid API key")
+        self.audio.speech.side_effect = AuthenticationError("Invalid API key")
+    
+    def reset(self):
+        """Reset recorded calls and configuration back to the failing behavior."""
+        self.audio.speech.reset()
+        self._setup_failing_audio_mock()
 
 
-@pytest.fixture
+# Session-scoped client instances that must be reset between tests
+_shared_openai_clients = []
+
+
+@pytest.fixture(scope="session")
 def mock_openai_client():
-    """Fixture providing a mock OpenAI client."""
-    return MockOpenAIClient()
+    """Fixture providing a mock OpenAI client shared across the test session."""
+    client = MockOpenAIClient()
+    _shared_openai_clients.append(client)
+    return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def failing_openai_client():
-    """Fixture providing a failing OpenAI client."""
-    return MockFailingOpenAIClient()
+    """Fixture providing a failing OpenAI client shared across the test session."""
+    client = MockFailingOpenAIClient()
+    _shared_openai_clients.append(client)
+    return client
 
 
-@pytest.fixture
-def temp_audio_dir(tmp_path):
-    """Fixture providing a temporary audio directory for tests."""
-    audio_dir = tmp_path / "audio"
-    audio_dir.mkdir()
-    return audio_dir
+@pytest.fixture(autouse=True)
+def reset_openai_client_mocks():
+    """Reset the shared OpenAI client mocks after each test."""
+    yield
+    for client in _shared_openai_clients:
+        client.reset()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def temp_audio_dir(tmp_path_factory):
+    """Fixture providing a temporary audio directory shared across the test session."""
+    return tmp_path_factory.mktemp("audio")
+
+
+@pytest.fixture(scope="session")
 def mock_audio_file(temp_audio_dir):
-    """Fixture providing a mock audio file."""
+    """Fixture providing a read-only mock audio file; tests that modify it should use tmp_path."""
     audio_file = temp_audio_dir / "test_audio.mp3"
     audio_file.write_bytes(b"fake_audio_data")
     return audio_file
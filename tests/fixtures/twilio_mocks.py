@@ -9,6 +9,21 @@ from unittest.mock import Mock, MagicMock
 from twilio.base.exceptions import TwilioRestException
 
 
+def _twilio_error(uri, msg):
+    """Build a fresh Twilio error so raised instances never share a traceback."""
+    return TwilioRestException(status=400, uri=uri, msg=msg, code=20001)
+
+
+def _call_failed(*args, **kwargs):
+    """Side effect for calls.create that raises a new error on every call."""
+    raise _twilio_error("/calls", "Call failed")
+
+
+def _message_failed(*args, **kwargs):
+    """Side effect for messages.create that raises a new error on every call."""
+    raise _twilio_error("/messages", "Message failed")
+
+
 class MockTwilioCall:
     """Mock Twilio call object."""
     
@@ -69,61 +84,75 @@ class MockTwilioClient:
         
         # Mock message listing
         self.messages.list.return_value = [mock_message]
+    
+    def reset(self):
+        """Reset recorded calls and configuration back to the default behavior."""
+        self.calls.reset_mock(return_value=True, side_effect=True)
+        self.messages.reset_mock(return_value=True, side_effect=True)
+        self._setup_calls_mock()
+        self._setup_messages_mock()
 
 
-@pytest.fixture
+class MockFailingTwilioClient(MockTwilioClient):
+    """Mock Twilio client whose call and message creation always fail."""
+    
+    def _setup_calls_mock(self):
+        """Setup calls mock so that creating a call fails."""
+        super()._setup_calls_mock()
+        self.calls.create.side_effect = _call_failed
+    
+    def _setup_messages_mock(self):
+        """Setup messages mock so that creating a message fails."""
+        super()._setup_messages_mock()
+        self.messages.create.side_effect = _message_failed
+
+
+# Session-scoped client instances that must be reset between tests
+_shared_twilio_clients = []
+
+
+@pytest.fixture(scope="session")
 def mock_twilio_client():
-    """Fixture providing a comprehensive mock Twilio client."""
-    return MockTwilioClient()
+    """Fixture providing a comprehensive mock Twilio client shared across the test session."""
+    client = MockTwilioClient()
+    _shared_twilio_clients.append(client)
+    return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_twilio_call():
-    """Fixture providing a mock Twilio call object."""
+    """Fixture providing a mock Twilio call object shared across the test session."""
     return MockTwilioCall()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_twilio_message():
-    """Fixture providing a mock Twilio message object."""
+    """Fixture providing a mock Twilio message object shared across the test session."""
     return MockTwilioMessage()
 
 
 @pytest.fixture
 def mock_twilio_exception():
     """Fixture providing a mock Twilio exception."""
-    return TwilioRestException(
-        status=400,
-        uri="/test",
-        msg="Test error",
-        code=20001
-    )
+    return _twilio_error("/test", "Test error")
 
 
 def create_failing_twilio_client():
     """Create a Twilio client mock that simulates failures."""
-    client = MockTwilioClient()
-    
-    # Make calls fail
-    client.calls.create.side_effect = TwilioRestException(
-        status=400,
-        uri="/calls",
-        msg="Call failed",
-        code=20001
-    )
-    
-    # Make messages fail
-    client.messages.create.side_effect = TwilioRestException(
-        status=400,
-        uri="/messages",
-        msg="Message failed",
-        code=20001
-    )
-    
-    return client
+    return MockFailingTwilioClient()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def failing_twilio_client():
-    """Fixture providing a Twilio client that simulates failures."""
-    return create_failing_twilio_client()
+    """Fixture providing a failing Twilio client shared across the test session."""
+    client = create_failing_twilio_client()
+    _shared_twilio_clients.append(client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def reset_twilio_client_mocks():
+    """Reset the shared Twilio client mocks after each test."""
+    yield
+    for client in _shared_twilio_clients:
+        client.reset()
@@ -3,30 +3,35 @@ Tests for the BurnMessageService class.
 """
 import pytest
 import uuid
-from unittest.mock import Mock, patch, AsyncMock
-from sqlmodel import Session
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
+from sqlalchemy import Delete
 
 from app.services.burn_message_service import BurnMessageService
 from app.models import BurnMessage, Contact, PhoneNumber
 
 
+async def _sent(*args, **kwargs):
+    """Report every SMS as sent."""
+    return True
+
+
 class TestBurnMessageService:
     """Test suite for BurnMessageService."""
     
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        return Mock(spec=Session)
-    
     @pytest.fixture
     def burn_message_service(self, mock_session):
         """Create a BurnMessageService instance with a mock session."""
         return BurnMessageService(mock_session)
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
+    def now(self):
+        """Snapshot the current time once for the expiry timestamps in this class."""
+        return datetime.now()
+    
+    @pytest.fixture(scope="class")
     def sample_contact(self):
-        """Create a sample contact for testing."""
+        """Create a read-only sample contact shared by the tests in this class."""
         contact = Contact(
             id=uuid.uuid4(),
             name="Test Contact",
@@ -42,9 +47,9 @@ class TestBurnMessageService:
         contact.phone_numbers = [phone]
         return contact
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_phone_numbers(self):
-        """Create sample phone numbers for testing."""
+        """Create read-only sample phone numbers shared by the tests in this class."""
         return [
             PhoneNumber(id=uuid.uuid4(), contact_id=uuid.uuid4(), number="+1234567890", priority=1),
         ]
@@ -67,19 +72,16 @@ class TestBurnMessageService:
         assert len(token2) > 0
         assert token1 != token2  # Should generate unique tokens
     
-    def test_create_burn_message_success(self, burn_message_service):
+    def test_create_burn_message_success(self, burn_message_service, now):
         """Test successful burn message creation."""
         # Setup mocks
         mock_burn_message = BurnMessage(
             id=uuid.uuid4(),
             token="test_token",
             content="Test content",
-            expires_at=datetime.now() + timedelta(hours=24),
+            expires_at=now + timedelta(hours=24),
             viewed=False
         )
-        burn_message_service.session.add = Mock()
-        burn_message_service.session.commit = Mock()
-        burn_message_service.session.refresh = Mock()
         
         # Test the method
         with patch.object(burn_message_service, 'generate_token', return_value="test_token"):
@@ -92,20 +94,17 @@ class TestBurnMessageService:
         burn_message_service.session.add.assert_called_once()
         burn_message_service.session.commit.assert_called_once()
     
-    def test_get_burn_message_success(self, burn_message_service):
+    def test_get_burn_message_success(self, burn_message_service, now):
         """Test successful burn message retrieval."""
         # Setup mock
         mock_burn_message = BurnMessage(
             id=uuid.uuid4(),
             token="test_token",
             content="Test content",
-            expires_at=datetime.now() + timedelta(hours=1),
+            expires_at=now + timedelta(hours=1),
             viewed=False
         )
-        burn_message_service.session.exec = Mock()
-        burn_message_service.session.exec().first = Mock(return_value=mock_burn_message)
-        burn_message_service.session.add = Mock()
-        burn_message_service.session.commit = Mock()
+        burn_message_service.session.exec.return_value.first.return_value = mock_burn_message
         
         # Test the method
         result = burn_message_service.get_burn_message("test_token", mark_as_viewed=True)
@@ -114,24 +113,21 @@ class TestBurnMessageService:
         assert isinstance(result, BurnMessage)
         assert result.token == "test_token"
         assert result.viewed is True
-        burn_message_service.session.exec().first.assert_called_once()
+        burn_message_service.session.exec.return_value.first.assert_called_once()
         burn_message_service.session.add.assert_called_once()
         burn_message_service.session.commit.assert_called_once()
     
-    def test_get_burn_message_expired(self, burn_message_service):
+    def test_get_burn_message_expired(self, burn_message_service, now):
         """Test retrieval of expired burn message."""
         # Setup mock for expired message
         mock_burn_message = BurnMessage(
             id=uuid.uuid4(),
             token="test_token",
             content="Test content",
-            expires_at=datetime.now() - timedelta(hours=1),  # Expired
+            expires_at=now - timedelta(hours=1),  # Expired
             viewed=False
         )
-        burn_message_service.session.exec = Mock()
-        burn_message_service.session.exec().first = Mock(return_value=mock_burn_message)
-        burn_message_service.session.delete = Mock()
-        burn_message_service.session.commit = Mock()
+        burn_message_service.session.exec.return_value.first.return_value = mock_burn_message
         
         # Test the method
         result = burn_message_service.get_burn_message("test_token", mark_as_viewed=True)
@@ -144,21 +140,20 @@ class TestBurnMessageService:
     def test_get_burn_message_not_found(self, burn_message_service):
         """Test retrieval of non-existent burn message."""
         # Setup mock for not found
-        burn_message_service.session.exec = Mock()
-        burn_message_service.session.exec().first = Mock(return_value=None)
+        burn_message_service.session.exec.return_value.first.return_value = None
         
         # Test the method
         result = burn_message_service.get_burn_message("nonexistent_token", mark_as_viewed=True)
         
         # Assertions
         assert result is None
-        burn_message_service.session.exec().first.assert_called_once()
+        burn_message_service.session.exec.return_value.first.assert_called_once()
     
-    async def test_send_burn_message_sms_success(self, burn_message_service, sample_contact):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_send_burn_message_sms_success(self, burn_message_service, sample_contact, now):
         """Test successful burn message SMS sending."""
         # Setup mocks
-        burn_message_service.session.exec = Mock()
-        burn_message_service.session.exec().first = Mock(return_value=None)
+        burn_message_service.session.exec.return_value.first.return_value = None
         
         # Mock the SMS repository methods
         mock_contacts = [sample_contact]
@@ -168,7 +163,7 @@ class TestBurnMessageService:
             id=uuid.uuid4(),
             token="test_token",
             content="Burn content",
-            expires_at=datetime.now() + timedelta(hours=24),
+            expires_at=now + timedelta(hours=24),
             viewed=False
         )
         with patch.object(burn_message_service, 'create_burn_message', return_value=mock_burn_message):
@@ -176,7 +171,7 @@ class TestBurnMessageService:
             with patch('app.services.sms_service.SmsService') as mock_sms_service_class:
                 mock_sms_service_instance = Mock()
                 # Mock the _send_to_contact method to return True (success)
-                mock_sms_service_instance._send_to_contact = AsyncMock(return_value=True)
+                mock_sms_service_instance._send_to_contact = _sent
                 mock_sms_service_class.return_value = mock_sms_service_instance
                 
                 # Test the method
@@ -190,39 +185,20 @@ class TestBurnMessageService:
                 assert result["status"] == "success"
                 assert result["sent_count"] == 1
                 assert result["failed_count"] == 0
-                
-                # Test the method
-                result = await burn_message_service.send_burn_message_sms(
-                    message_content="SMS with burn message link",
-                    burn_content="Secret content",
-                    recipients=[uuid.uuid4()]
-                )
-                
-                # Assertions
-                assert result["status"] == "success"
-                assert result["sent_count"] == 1
-                assert result["failed_count"] == 0
     
     def test_clean_expired_messages(self, burn_message_service):
         """Test cleaning expired messages."""
-        # Setup mocks
-        expired_messages = [
-            BurnMessage(id=uuid.uuid4(), token="token1", content="content1", 
-                       expires_at=datetime.now() - timedelta(hours=1), viewed=False),
-            BurnMessage(id=uuid.uuid4(), token="token2", content="content2", 
-                       expires_at=datetime.now() - timedelta(hours=2), viewed=True)
-        ]
-        
-        mock_exec_result = Mock()
-        mock_exec_result.all = Mock(return_value=expired_messages)
-        burn_message_service.session.exec = Mock(return_value=mock_exec_result)
-        burn_message_service.session.delete = Mock()
-        burn_message_service.session.commit = Mock()
+        # Setup mock for a bulk delete removing two rows
+        burn_message_service.session.exec.return_value.rowcount = 2
         
         # Test the method
         deleted_count = burn_message_service.clean_expired_messages()
         
         # Assertions
         assert deleted_count == 2
-        assert burn_message_service.session.delete.call_count == 2
+        burn_message_service.session.exec.assert_called_once()
+        statement = burn_message_service.session.exec.call_args.args[0]
+        assert isinstance(statement, Delete)
+        assert statement.table.name == BurnMessage.__tablename__
+        burn_message_service.session.delete.assert_not_called()
         burn_message_service.session.commit.assert_called_once()
@@ -3,38 +3,62 @@ Tests for the CallService class.
 """
 import pytest
 import uuid
-from unittest.mock import Mock, patch, AsyncMock
-from sqlmodel import Session
+from contextlib import nullcontext
+from unittest.mock import Mock, patch
 from twilio.base.exceptions import TwilioRestException
 
 from app.services.call_service import CallService
+from app.repositories.call_repository import CallRepository
 from app.models import Contact, PhoneNumber, CallLog, CallRun
-from tests.fixtures.twilio_mocks import MockTwilioClient, failing_twilio_client
+from tests.fixtures.twilio_mocks import failing_twilio_client
+
+
+async def _no_sleep(*args, **kwargs):
+    """Return immediately instead of pausing."""
+    return None
+
+
+async def _answered(*args, **kwargs):
+    """Report every call as answered."""
+    return True
 
 
 class TestCallService:
     """Test suite for CallService."""
     
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        return Mock(spec=Session)
+    @pytest.fixture(scope="class", autouse=True)
+    def twilio_client_class(self):
+        """Keep CallService from constructing a real Twilio client in any test."""
+        with patch('app.services.call_service.Client') as client_class:
+            yield client_class
+    
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        """Make the pauses between call attempts return immediately."""
+        monkeypatch.setattr("app.services.call_service.asyncio.sleep", _no_sleep)
     
     @pytest.fixture
-    def mock_twilio_client(self):
-        """Create a mock Twilio client."""
-        return MockTwilioClient()
+    def mock_repository(self, sample_contact, sample_phone_numbers):
+        """Create a call repository mock pre-wired for the happy path."""
+        repository = Mock(spec=CallRepository)
+        repository.get_contacts_by_ids.return_value = [sample_contact]
+        repository.get_contacts_by_group_id.return_value = [sample_contact]
+        repository.get_phone_for_contact.return_value = (sample_phone_numbers, [])
+        repository.create_call_log.return_value = Mock(spec=CallLog)
+        repository.create_call_run.return_value = Mock(spec=CallRun)
+        return repository
     
     @pytest.fixture
-    def call_service(self, mock_session, mock_twilio_client):
+    def call_service(self, mock_session, mock_twilio_client, mock_repository):
         """Create a CallService instance with mock dependencies."""
         service = CallService(mock_session)
         service.twilio_client = mock_twilio_client
+        service.repository = mock_repository
         return service
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_contact(self, sample_phone_numbers):
-        """Create a sample contact for testing."""
+        """Create a read-only sample contact shared by the tests in this class."""
         contact = Contact(
             id=uuid.uuid4(),
             name="Test Contact",
@@ -44,58 +68,39 @@ class TestCallService:
         contact.phone_numbers = sample_phone_numbers
         return contact
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_phone_numbers(self):
-        """Create sample phone numbers for testing."""
+        """Create read-only sample phone numbers shared by the tests in this class."""
         return [
             PhoneNumber(id=uuid.uuid4(), contact_id=uuid.uuid4(), number="+1234567890", priority=1),
             PhoneNumber(id=uuid.uuid4(), contact_id=uuid.uuid4(), number="+0987654321", priority=2)
         ]
     
-    def test_init(self, mock_session):
+    def test_init(self, mock_session, twilio_client_class):
         """Test CallService initialization."""
-        with patch('app.services.call_service.Client') as mock_client:
-            service = CallService(mock_session)
-            assert service.session == mock_session
-            assert service.repository is not None
-            assert service.twilio_client is not None
+        service = CallService(mock_session)
+        assert service.session == mock_session
+        assert service.repository is not None
+        assert service.twilio_client is twilio_client_class.return_value
     
-    def test_make_twilio_call_success(self, call_service):
-        """Test successful Twilio call creation."""
-        # Setup mock
-        mock_call_instance = Mock()
-        mock_call_instance.sid = "CA1234567890"
-        call_service.twilio_client.calls.create.return_value = mock_call_instance
-        
-        # Test the method
-        call_sid = call_service.make_twilio_call("+1234567890", uuid.uuid4())
+    @pytest.mark.parametrize("create_result, expectation", [
+        (Mock(sid="CA1234567890"), nullcontext("CA1234567890")),
+        (TwilioRestException(status=500, uri="test", msg="Test error"), pytest.raises(TwilioRestException)),
+    ], ids=["success", "failure"])
+    def test_make_twilio_call(self, call_service, create_result, expectation):
+        """Test Twilio call creation returning a SID or raising the Twilio error."""
+        call_service.twilio_client.calls.create.side_effect = [create_result]
         
-        # Assertions
-        assert call_sid == "CA1234567890"
+        with expectation as expected_sid:
+            assert call_service.make_twilio_call("+1234567890", uuid.uuid4()) == expected_sid
         call_service.twilio_client.calls.create.assert_called_once()
     
-    def test_make_twilio_call_failure(self, call_service):
-        """Test Twilio call creation failure."""
-        # Setup mock to raise exception
-        call_service.twilio_client.calls.create.side_effect = TwilioRestException(
-            status=500, 
-            uri="test", 
-            msg="Test error"
-        )
-        
-        # Test the method raises exception
-        with pytest.raises(TwilioRestException):
-            call_service.make_twilio_call("+1234567890", uuid.uuid4())
-    
-    @patch('app.services.call_service.asyncio.sleep', return_value=None)
-    async def test_make_custom_call_success(self, mock_sleep, call_service, sample_contact, sample_phone_numbers):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_make_custom_call_success(self, call_service):
         """Test successful custom call creation."""
         # Setup mocks
-        call_service._wait_for_answer = AsyncMock(return_value=True)
-        call_service.repository.get_contacts_by_ids = Mock(return_value=[sample_contact])
-        call_service.repository.get_contact_phone_numbers = Mock(return_value=sample_phone_numbers)
+        call_service._wait_for_answer = _answered
         call_service.make_twilio_call = Mock(return_value="CA1234567890")
-        call_service.repository.create_call_log = Mock(return_value=Mock(spec=CallLog))
         
         # Test the method
         result = await call_service.make_custom_call(
@@ -107,43 +112,21 @@ class TestCallService:
         assert result["success"] is True
         call_service.make_twilio_call.assert_called_once()
     
-    @patch('app.services.call_service.asyncio.sleep', return_value=None)
-    async def test_dial_contacts_success(self, mock_sleep, call_service, sample_contact, sample_phone_numbers):
-        """Test successful contact dialing."""
+    @pytest.mark.asyncio(loop_scope="class")
+    @pytest.mark.parametrize("lookup, target", [
+        ("get_contacts_by_ids", {"contacts": [uuid.uuid4()]}),
+        ("get_contacts_by_group_id", {"group_id": uuid.uuid4()}),
+    ], ids=["contacts", "group"])
+    async def test_dial_contacts_success(self, call_service, lookup, target):
+        """Test successful dialing of individual contacts and of a group."""
         # Setup mocks
-        call_service.repository.get_contacts_by_ids = Mock(return_value=[sample_contact])
-        call_service.repository.get_contact_phone_numbers = Mock(return_value=sample_phone_numbers)
         call_service.make_twilio_call = Mock(return_value="CA1234567890")
-        call_service.repository.create_call_log = Mock(return_value=Mock(spec=CallLog))
-        call_service.repository.create_call_run = Mock(return_value=Mock(spec=CallRun))
         
         # Test the method
-        result = await call_service.dial_contacts(
-            contacts=[uuid.uuid4()],
-            message_id=uuid.uuid4()
-        )
-        
-        # Assertions
-        assert result["status"] == "success"
-        assert result["total_contacts"] == 1
-        call_service.make_twilio_call.assert_called_once()
-    
-    async def test_dial_contacts_with_group(self, call_service, sample_contact, sample_phone_numbers):
-        """Test successful group dialing."""
-        # Setup mocks
-        call_service.repository.get_contacts_by_group_id = Mock(return_value=[sample_contact])
-        call_service.repository.get_contact_phone_numbers = Mock(return_value=sample_phone_numbers)
-        call_service.make_twilio_call = Mock(return_value="CA1234567890")
-        call_service.repository.create_call_log = Mock(return_value=Mock(spec=CallLog))
-        call_service.repository.create_call_run = Mock(return_value=Mock(spec=CallRun))
-        
-        # Test the method
-        result = await call_service.dial_contacts(
-            group_id=uuid.uuid4(),
-            message_id=uuid.uuid4()
-        )
+        result = await call_service.dial_contacts(message_id=uuid.uuid4(), **target)
         
         # Assertions
         assert result["status"] == "success"
         assert result["total_contacts"] == 1
+        getattr(call_service.repository, lookup).assert_called_once()
         call_service.make_twilio_call.assert_called_once()
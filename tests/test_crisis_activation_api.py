@@ -0,0 +1,108 @@
+"""
+Tester för krisaktivering via Crisis Management API
+"""
+from unittest.mock import AsyncMock
+
+from tests.fixtures.database_fixtures import (
+    session_test_engine, session_test_connection, session_test_session, test_session
+)
+from tests.fixtures.crisis_fixtures import sample_user, sample_crisis_activation
+from tests.fixtures.crisis_api_data import (
+    ACTIVATE_JSON, DASHBOARD, JSON_HEADERS, chained_query, fake_crisis, next_uuid
+)
+
+
+class TestCrisisActivationAPI:
+    """Tester för krisaktivering API endpoints"""
+    
+    def test_activate_crisis_success(self, client, mock_crisis_service, sample_user):
+        """Test framgångsrik krisaktivering"""
+        # Mock service response
+        mock_crisis = fake_crisis(activated_by_user_id=sample_user.id)
+        
+        mock_crisis_service.activate_crisis_response = AsyncMock(return_value=mock_crisis)
+        
+        # Gör API-anrop
+        response = client.post("/api/v1/crisis/activate", content=ACTIVATE_JSON, headers=JSON_HEADERS)
+        
+        # Verifiera respons
+        assert response.status_code == 201
+        data = response.json()
+        assert data["crisis_name"] == "Test Kris"
+        assert data["crisis_level"] == "emergency"
+        assert data["is_active"] is True
+    
+    def test_get_crisis_list(self, client, mock_crisis_service):
+        """Test hämtning av krislista"""
+        # Mock service response
+        mock_crisis_service.session.query.return_value = chained_query(count=2, all=[])
+        
+        response = client.get("/api/v1/crisis/")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert "crises" in data
+        assert "total_count" in data
+        assert "active_count" in data
+        assert "resolved_count" in data
+    
+    def test_get_crisis_by_id(self, client, mock_crisis_service, sample_crisis_activation):
+        """Test hämtning av specifik kris"""
+        # Mock service response
+        mock_crisis_service.session.get.return_value = sample_crisis_activation
+        mock_crisis_service.session.query.return_value = chained_query(count=5)
+        
+        response = client.get(f"/api/v1/crisis/{sample_crisis_activation.id}")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == str(sample_crisis_activation.id)
+        assert data["crisis_name"] == sample_crisis_activation.crisis_name
+    
+    def test_get_crisis_not_found(self, client, mock_crisis_service):
+        """Test hämtning av icke-existerande kris"""
+        mock_crisis_service.session.get.return_value = None
+        
+        non_existent_id = next_uuid()
+        response = client.get(f"/api/v1/crisis/{non_existent_id}")
+        
+        assert response.status_code == 404
+    
+    def test_get_crisis_dashboard(self, client, mock_crisis_service):
+        """Test krisdashboard endpoint"""
+        mock_crisis_service.get_crisis_dashboard_data.return_value = DASHBOARD
+        
+        crisis_id = next_uuid()
+        response = client.get(f"/api/v1/crisis/{crisis_id}/dashboard")
+        
+        assert response.status_code == 200
+        mock_crisis_service.get_crisis_dashboard_data.assert_called_once_with(crisis_id)
+    
+    def test_update_crisis(self, client, mock_crisis_service):
+        """Test uppdatering av kris"""
+        crisis = fake_crisis()
+        mock_crisis_service.session.get.return_value = crisis
+        
+        update_data = {
+            "crisis_name": "Uppdaterat Krisnamn",
+            "urgency_level": 5
+        }
+        
+        response = client.put(f"/api/v1/crisis/{crisis.id}", json=update_data)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["crisis_name"] == "Uppdaterat Krisnamn"
+    
+    def test_resolve_crisis(self, client, mock_crisis_service):
+        """Test avslutning av kris"""
+        # Lokal kris så att den delade fixturen inte muteras
+        crisis = fake_crisis(is_active=True)
+        mock_crisis_service.session.get.return_value = crisis
+        
+        response = client.post(f"/api/v1/crisis/{crisis.id}/resolve")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert "resolved_at" in data
+        assert crisis.is_active is False
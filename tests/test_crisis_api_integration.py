@@ -0,0 +1,33 @@
+"""
+Integrationstester för Crisis Management API
+"""
+import pytest
+
+
+class TestCrisisAPIIntegration:
+    """Integrationstester för Crisis API"""
+    
+    @pytest.mark.skip(reason="Kräver riktig databas och mockade beroenden")
+    def test_full_crisis_api_workflow(self, client):
+        """Test komplett API-flöde för krishantering"""
+        # Detta skulle kräva en mer komplex setup med riktig databas
+        # och mocking av alla dependencies
+        pass
+    
+    @pytest.mark.parametrize("path", [
+        "/api/v1/crisis/{uid}",
+        "/api/v1/crisis/{uid}/dashboard",
+        "/api/v1/crisis/{uid}/personnel",
+    ], ids=["crisis", "dashboard", "personnel"])
+    def test_api_invalid_uuid(self, client, path):
+        """Test att ogiltiga UUID:er ger valideringsfel"""
+        response = client.get(path.format(uid="not-a-uuid"))
+        assert response.status_code == 422  # Validation error
+    
+    @pytest.mark.skip(reason="Autentiseringen är fortfarande en placeholder")
+    def test_api_authentication(self, client):
+        """Test autentisering för API endpoints"""
+        # Eftersom vi använder en placeholder för autentisering,
+        # testar vi bara att endpoints är tillgängliga
+        # I en riktig implementation skulle vi testa JWT tokens etc.
+        pass
@@ -0,0 +1,50 @@
+"""
+Tester för validering i Crisis Management API
+"""
+import asyncio
+import pytest
+
+from pydantic import ValidationError
+
+from app.schemas.crisis_management import CrisisActivationCreate
+
+from tests.fixtures.crisis_api_data import (
+    INVALID_ACTIVATION_MISSING_FIELDS, INVALID_ACTIVATION_VALUES,
+    INVALID_ACTIVATION_VALUES_JSON, INVALID_PERSONNEL_UPDATE_JSON, JSON_HEADERS, next_uuid
+)
+
+
+class TestCrisisAPIValidation:
+    """Tester för API-validering"""
+    
+    @pytest.mark.parametrize("invalid_data", [
+        INVALID_ACTIVATION_MISSING_FIELDS,
+        INVALID_ACTIVATION_VALUES,
+    ], ids=["missing_fields", "invalid_values"])
+    def test_crisis_activation_schema_validation(self, invalid_data):
+        """Test att schemat avvisar ogiltig krisaktivering utan HTTP-anrop"""
+        with pytest.raises(ValidationError):
+            CrisisActivationCreate(**invalid_data)
+    
+    @pytest.mark.asyncio
+    async def test_validation_errors(self, async_client):
+        """Test att ogiltiga payloads ger 422 via API:t, skickade parallellt"""
+        activation_id = next_uuid()
+        requests = {
+            "activation_invalid_values": async_client.post(
+                "/api/v1/crisis/activate",
+                content=INVALID_ACTIVATION_VALUES_JSON,
+                headers=JSON_HEADERS
+            ),
+            "personnel_update": async_client.put(
+                f"/api/v1/crisis/personnel/{activation_id}",
+                content=INVALID_PERSONNEL_UPDATE_JSON,
+                headers=JSON_HEADERS
+            ),
+        }
+        
+        responses = await asyncio.gather(*requests.values())
+        
+        # Alla ska returnera valideringsfel utan att nå tjänsten
+        for name, response in zip(requests, responses):
+            assert response.status_code == 422, name
@@ -4,21 +4,50 @@ Tester för krishanteringsmodeller
 import pytest
 import uuid
 from datetime import datetime, timedelta
-from sqlmodel import Session, select
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import Session, func, select
 
 from app.models import (
     CrisisActivation, PersonnelActivation, ManualEscalation, CrisisTemplate,
     Contact, PhoneNumber, User, CrisisLevel, PersonnelRole
 )
-from tests.fixtures.database_fixtures import test_session, clean_test_session
+from tests.fixtures.database_fixtures import (
+    session_test_engine, session_test_connection, session_test_session,
+    test_session
+)
 from tests.fixtures.crisis_fixtures import (
-    sample_user, emergency_contacts, crisis_template,
+    sample_user, emergency_contacts, emergency_group, crisis_template,
     sample_crisis_activation, personnel_activations,
     confirmed_personnel_activation, declined_personnel_activation,
-    escalated_personnel_activation, manual_escalation
+    escalated_personnel_activation, manual_escalation, crisis_test_data_fast
 )
 
 
+# Fast tidpunkt; testerna kontrollerar bara att tidsfälten sätts, inte deras värde
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _get_crisis_with_relations(session: Session, crisis_id: uuid.UUID) -> CrisisActivation:
+    """Hämta en kris med aktiverande användare, personal och eskaleringar inlästa i samma omgång"""
+    statement = (
+        select(CrisisActivation)
+        .options(
+            joinedload(CrisisActivation.activated_by),
+            selectinload(CrisisActivation.personnel_activations),
+            selectinload(CrisisActivation.escalations)
+        )
+        .where(CrisisActivation.id == crisis_id)
+    )
+    return session.exec(statement).one()
+
+
+@pytest.fixture
+def read_only_session(test_session: Session) -> Session:
+    """Testsession utan autoflush för tester som bara läser"""
+    with test_session.no_autoflush:
+        yield test_session
+
+
 class TestCrisisActivationModel:
     """Tester för CrisisActivation-modellen"""
     
@@ -35,8 +64,7 @@ class TestCrisisActivationModel:
         )
         
         test_session.add(crisis)
-        test_session.commit()
-        test_session.refresh(crisis)
+        test_session.flush()
         
         assert crisis.id is not None
         assert crisis.crisis_name == "Test Översvämning"
@@ -46,14 +74,14 @@ class TestCrisisActivationModel:
         assert isinstance(crisis.activated_at, datetime)
     
     def test_crisis_activation_relationships(
-        self, 
-        test_session: Session, 
+        self,
+        read_only_session: Session,
         sample_crisis_activation: CrisisActivation,
         personnel_activations: list
     ):
         """Test relationer för CrisisActivation"""
         # Hämta krisen med relationer
-        crisis = test_session.get(CrisisActivation, sample_crisis_activation.id)
+        crisis = _get_crisis_with_relations(read_only_session, sample_crisis_activation.id)
         
         # Kontrollera att personal-relationer fungerar
         assert len(crisis.personnel_activations) > 0
@@ -63,41 +91,33 @@ class TestCrisisActivationModel:
         assert crisis.activated_by is not None
         assert crisis.activated_by.username == "crisis_admin"
     
-    def test_crisis_activation_enum_validation(self, test_session: Session, sample_user: User):
-        """Test att enum-värden valideras korrekt"""
-        # Test giltigt CrisisLevel
-        crisis = CrisisActivation(
-            crisis_name="Test",
-            crisis_type="test",
-            crisis_level=CrisisLevel.DISASTER,
-            geographic_area="Test",
-            activated_by_user_id=sample_user.id,
-            primary_message="Test",
-            urgency_level=5
-        )
-        
-        test_session.add(crisis)
-        test_session.commit()
-        
-        assert crisis.crisis_level == CrisisLevel.DISASTER
-    
-    def test_crisis_activation_urgency_constraints(self, test_session: Session, sample_user: User):
-        """Test att urgency_level följer constraints (1-5)"""
-        # Test giltig urgency_level
+    @pytest.mark.parametrize("level, urgency", [
+        (CrisisLevel.DISASTER, 5),
+        (CrisisLevel.STANDBY, 3),
+    ], ids=["disaster", "standby"])
+    def test_crisis_activation_field_validation(
+        self,
+        test_session: Session,
+        sample_user: User,
+        level: CrisisLevel,
+        urgency: int
+    ):
+        """Test att CrisisLevel och urgency_level (1-5) valideras korrekt"""
         crisis = CrisisActivation(
             crisis_name="Test",
             crisis_type="test",
-            crisis_level=CrisisLevel.STANDBY,
+            crisis_level=level,
             geographic_area="Test",
             activated_by_user_id=sample_user.id,
             primary_message="Test",
-            urgency_level=3
+            urgency_level=urgency
         )
         
         test_session.add(crisis)
-        test_session.commit()
+        test_session.flush()
         
-        assert crisis.urgency_level == 3
+        assert crisis.crisis_level == level
+        assert crisis.urgency_level == urgency
     
     def test_resolve_crisis(self, test_session: Session, sample_crisis_activation: CrisisActivation):
         """Test att avsluta en kris"""
@@ -107,13 +127,12 @@ class TestCrisisActivationModel:
         
         # Avsluta krisen
         crisis.is_active = False
-        crisis.resolved_at = datetime.now()
+        crisis.resolved_at = _NOW
         
         test_session.commit()
         test_session.refresh(crisis)
         
         assert crisis.is_active is False
-        assert crisis.resolved_at is not None
         assert isinstance(crisis.resolved_at, datetime)
 
 
@@ -135,12 +154,11 @@ class TestPersonnelActivationModel:
             assigned_role=PersonnelRole.CRISIS_LEADER,
             priority_level=1,
             meeting_location="Kriscentrum",
-            required_arrival_time=datetime.now() + timedelta(hours=1)
+            required_arrival_time=_NOW + timedelta(hours=1)
         )
         
         test_session.add(activation)
-        test_session.commit()
-        test_session.refresh(activation)
+        test_session.flush()
         
         assert activation.id is not None
         assert activation.assigned_role == PersonnelRole.CRISIS_LEADER
@@ -150,7 +168,7 @@ class TestPersonnelActivationModel:
     
     def test_personnel_activation_relationships(
         self,
-        test_session: Session,
+        read_only_session: Session,
         personnel_activations: list
     ):
         """Test relationer för PersonnelActivation"""
@@ -179,71 +197,63 @@ class TestPersonnelActivationModel:
         assert activation.response_received_at is not None
         assert activation.estimated_arrival is not None
     
+    @pytest.mark.parametrize("role", [
+        PersonnelRole.CRISIS_LEADER,
+        PersonnelRole.DEPUTY_LEADER,
+        PersonnelRole.OPERATIONS_CHIEF,
+        PersonnelRole.INFORMATION_OFFICER,
+        PersonnelRole.LOGISTICS_CHIEF,
+        PersonnelRole.MEDICAL_OFFICER,
+        PersonnelRole.TECHNICAL_EXPERT,
+        PersonnelRole.SUPPORT_STAFF,
+        PersonnelRole.VOLUNTEER
+    ], ids=lambda role: role.value)
     def test_personnel_role_enum_validation(
         self,
         test_session: Session,
         sample_crisis_activation: CrisisActivation,
-        emergency_contacts: list
+        emergency_contacts: list,
+        role: PersonnelRole
     ):
         """Test att PersonnelRole enum valideras"""
-        contact = emergency_contacts[0]
-        
-        # Test alla giltiga roller
-        valid_roles = [
-            PersonnelRole.CRISIS_LEADER,
-            PersonnelRole.DEPUTY_LEADER,
-            PersonnelRole.OPERATIONS_CHIEF,
-            PersonnelRole.INFORMATION_OFFICER,
-            PersonnelRole.LOGISTICS_CHIEF,
-            PersonnelRole.MEDICAL_OFFICER,
-            PersonnelRole.TECHNICAL_EXPERT,
-            PersonnelRole.SUPPORT_STAFF,
-            PersonnelRole.VOLUNTEER
-        ]
-        
-        for role in valid_roles:
-            activation = PersonnelActivation(
-                crisis_id=sample_crisis_activation.id,
-                contact_id=contact.id,
-                assigned_role=role,
-                priority_level=2
-            )
-            
-            test_session.add(activation)
-            test_session.commit()
-            
-            assert activation.assigned_role == role
-            
-            # Rensa för nästa test
-            test_session.delete(activation)
-            test_session.commit()
+        activation_id = uuid.uuid4()
+        # Ingen ORM-instans behövs för en ren rundtur genom schemat;
+        # SAVEPOINT-rollbacken städar efter testet
+        test_session.bulk_insert_mappings(PersonnelActivation, [{
+            "id": activation_id,
+            "crisis_id": sample_crisis_activation.id,
+            "contact_id": emergency_contacts[0].id,
+            "assigned_role": role,
+            "priority_level": 2
+        }])
+        
+        stored_role = test_session.exec(
+            select(PersonnelActivation.assigned_role).where(PersonnelActivation.id == activation_id)
+        ).one()
+        assert stored_role == role
     
+    @pytest.mark.parametrize("priority", [1, 2, 3, 4, 5])
     def test_priority_level_constraints(
         self,
         test_session: Session,
         sample_crisis_activation: CrisisActivation,
-        emergency_contacts: list
+        emergency_contacts: list,
+        priority: int
     ):
         """Test att priority_level följer constraints (1-5)"""
-        contact = emergency_contacts[0]
-        
-        # Test giltiga prioritetsnivåer
-        for priority in [1, 2, 3, 4, 5]:
-            activation = PersonnelActivation(
-                crisis_id=sample_crisis_activation.id,
-                contact_id=contact.id,
-                assigned_role=PersonnelRole.SUPPORT_STAFF,
-                priority_level=priority
-            )
-            
-            test_session.add(activation)
-            test_session.commit()
-            
-            assert activation.priority_level == priority
-            
-            # Rensa för nästa test
-            test_session.delete(activation)
-            test_session.commit()
+        activation_id = uuid.uuid4()
+        test_session.bulk_insert_mappings(PersonnelActivation, [{
+            "id": activation_id,
+            "crisis_id": sample_crisis_activation.id,
+            "contact_id": emergency_contacts[0].id,
+            "assigned_role": PersonnelRole.SUPPORT_STAFF,
+            "priority_level": priority
+        }])
+        
+        stored_priority = test_session.exec(
+            select(PersonnelActivation.priority_level).where(PersonnelActivation.id == activation_id)
+        ).one()
+        assert stored_priority == priority
 
 
 class TestManualEscalationModel:
@@ -266,8 +276,7 @@ class TestManualEscalationModel:
         )
         
         test_session.add(escalation)
-        test_session.commit()
-        test_session.refresh(escalation)
+        test_session.flush()
         
         assert escalation.id is not None
         assert escalation.escalation_reason == "no_answer"
@@ -278,7 +287,7 @@ class TestManualEscalationModel:
     
     def test_manual_escalation_relationships(
         self,
-        test_session: Session,
+        read_only_session: Session,
         manual_escalation: ManualEscalation
     ):
         """Test relationer för ManualEscalation"""
@@ -294,14 +303,18 @@ class TestManualEscalationModel:
     
     def test_escalation_operator_assignment(
         self,
-        test_session: Session,
+        read_only_session: Session,
         manual_escalation: ManualEscalation
     ):
         """Test tilldelning av telefonist"""
-        escalation = manual_escalation
-        
-        assert escalation.assigned_to_operator == "Telefonist Anna"
-        assert escalation.operator_assigned_at is not None
+        # Läs bara de kolumner som kontrolleras
+        assigned_to_operator, operator_assigned_at = read_only_session.exec(
+            select(ManualEscalation.assigned_to_operator, ManualEscalation.operator_assigned_at)
+            .where(ManualEscalation.id == manual_escalation.id)
+        ).one()
+        
+        assert assigned_to_operator == "Telefonist Anna"
+        assert operator_assigned_at is not None
     
     def test_escalation_resolution(
         self,
@@ -312,19 +325,27 @@ class TestManualEscalationModel:
         escalation = manual_escalation
         
         # Markera som löst
-        escalation.contact_attempted_at = datetime.now()
+        escalation.contact_attempted_at = _NOW
         escalation.contact_successful = True
         escalation.contact_result = "confirmed"
         escalation.contact_notes = "Kontaktad via hemtelefon"
-        escalation.resolved_at = datetime.now()
+        escalation.resolved_at = _NOW
         
         test_session.commit()
-        test_session.refresh(escalation)
         
-        assert escalation.contact_successful is True
-        assert escalation.contact_result == "confirmed"
-        assert escalation.contact_notes == "Kontaktad via hemtelefon"
-        assert escalation.resolved_at is not None
+        contact_successful, contact_result, contact_notes, resolved_at = test_session.exec(
+            select(
+                ManualEscalation.contact_successful,
+                ManualEscalation.contact_result,
+                ManualEscalation.contact_notes,
+                ManualEscalation.resolved_at
+            ).where(ManualEscalation.id == escalation.id)
+        ).one()
+        
+        assert contact_successful is True
+        assert contact_result == "confirmed"
+        assert contact_notes == "Kontaktad via hemtelefon"
+        assert resolved_at is not None
 
 
 class TestCrisisTemplateModel:
@@ -353,8 +374,7 @@ class TestCrisisTemplateModel:
         )
         
         test_session.add(template)
-        test_session.commit()
-        test_session.refresh(template)
+        test_session.flush()
         
         assert template.id is not None
         assert template.template_name == "Brand Standard"
@@ -365,7 +385,7 @@ class TestCrisisTemplateModel:
     
     def test_crisis_template_relationships(
         self,
-        test_session: Session,
+        read_only_session: Session,
         crisis_template: CrisisTemplate
     ):
         """Test relationer för CrisisTemplate"""
@@ -377,19 +397,22 @@ class TestCrisisTemplateModel:
     
     def test_template_json_fields(
         self,
-        test_session: Session,
+        read_only_session: Session,
         crisis_template: CrisisTemplate
     ):
         """Test JSON-fält i mall"""
-        template = crisis_template
+        required_roles, priority_matrix = read_only_session.exec(
+            select(CrisisTemplate.required_roles, CrisisTemplate.priority_matrix)
+            .where(CrisisTemplate.id == crisis_template.id)
+        ).one()
         
         # Kontrollera att JSON-fält sparas korrekt
-        assert template.required_roles is not None
-        assert template.priority_matrix is not None
+        assert required_roles is not None
+        assert priority_matrix is not None
         
         # JSON-fält ska vara strängar (SQLModel hanterar serialisering)
-        assert isinstance(template.required_roles, str)
-        assert isinstance(template.priority_matrix, str)
+        assert isinstance(required_roles, str)
+        assert isinstance(priority_matrix, str)
     
     def test_template_constraints(
         self,
@@ -414,7 +437,7 @@ class TestCrisisTemplateModel:
         )
         
         test_session.add(template)
-        test_session.commit()
+        test_session.flush()
         
         assert template.max_call_attempts == 5
         assert template.call_timeout_seconds == 60
@@ -442,35 +465,32 @@ class TestCrisisModelIntegration:
             primary_message="Test av komplett flöde",
             urgency_level=3
         )
+        # Id:n genereras i Python, så inget flush behövs förrän commit i steg 4
         test_session.add(crisis)
-        test_session.commit()
-        test_session.refresh(crisis)
         
         # 2. Skapa personalaktiveringar
-        activations = []
-        for i, contact in enumerate(emergency_contacts[:3]):
-            activation = PersonnelActivation(
+        activations = [
+            PersonnelActivation(
                 crisis_id=crisis.id,
                 contact_id=contact.id,
                 assigned_role=PersonnelRole.CRISIS_LEADER if i == 0 else PersonnelRole.SUPPORT_STAFF,
                 priority_level=1 if i == 0 else 2
             )
-            test_session.add(activation)
-            activations.append(activation)
-        
-        test_session.commit()
+            for i, contact in enumerate(emergency_contacts[:3])
+        ]
+        test_session.add_all(activations)
         
         # 3. Simulera kommunikationsförsök
-        activations[0].call_attempted_at = datetime.now()
+        activations[0].call_attempted_at = _NOW
         activations[0].call_confirmed = True
         activations[0].response_status = "confirmed"
         
-        activations[1].sms_sent_at = datetime.now()
+        activations[1].sms_sent_at = _NOW
         activations[1].response_status = "declined"
         
         # 4. Skapa eskalering för tredje personen
         activations[2].escalated_to_manual = True
-        activations[2].escalated_at = datetime.now()
+        activations[2].escalated_at = _NOW
         
         escalation = ManualEscalation(
             crisis_id=crisis.id,
@@ -484,7 +504,7 @@ class TestCrisisModelIntegration:
         
         # 5. Verifiera hela strukturen
         # Hämta krisen med alla relationer
-        crisis_with_relations = test_session.get(CrisisActivation, crisis.id)
+        crisis_with_relations = _get_crisis_with_relations(test_session, crisis.id)
         
         assert len(crisis_with_relations.personnel_activations) == 3
         assert len(crisis_with_relations.escalations) == 1
@@ -502,26 +522,34 @@ class TestCrisisModelIntegration:
     
     def test_cascade_delete_behavior(
         self,
-        test_session: Session,
-        sample_crisis_activation: CrisisActivation,
-        personnel_activations: list,
-        manual_escalation: ManualEscalation
+        read_only_session: Session,
+        crisis_test_data_fast: dict
     ):
         """Test att relationer hanteras korrekt vid borttagning"""
-        crisis_id = sample_crisis_activation.id
-        activation_ids = [pa.id for pa in personnel_activations]
-        escalation_id = manual_escalation.id
-        
-        # Kontrollera att allt finns
-        assert test_session.get(CrisisActivation, crisis_id) is not None
-        assert all(test_session.get(PersonnelActivation, aid) is not None for aid in activation_ids)
-        assert test_session.get(ManualEscalation, escalation_id) is not None
+        # Hela kedjan kris -> personal -> eskalering sparas i en enda commit
+        crisis_id = crisis_test_data_fast["crisis"].id
+        activation_ids = [pa.id for pa in crisis_test_data_fast["activations"]]
+        escalation_id = crisis_test_data_fast["escalation"].id
+        
+        # Kontrollera att allt finns, en fråga per tabell
+        crisis_count = read_only_session.exec(
+            select(func.count()).select_from(CrisisActivation).where(CrisisActivation.id == crisis_id)
+        ).one()
+        assert crisis_count == 1
+        found_ids = set(read_only_session.exec(
+            select(PersonnelActivation.id).where(PersonnelActivation.id.in_(activation_ids))
+        ).all())
+        assert found_ids == set(activation_ids)
+        escalation_count = read_only_session.exec(
+            select(func.count()).select_from(ManualEscalation).where(ManualEscalation.id == escalation_id)
+        ).one()
+        assert escalation_count == 1
         
         # Ta bort krisen (beroende på foreign key constraints)
         # I en riktig applikation skulle vi hantera detta med soft delete
         # eller cascade delete policies
         
         # För nu testar vi bara att relationerna fungerar
-        crisis = test_session.get(CrisisActivation, crisis_id)
+        crisis = _get_crisis_with_relations(read_only_session, crisis_id)
         assert len(crisis.personnel_activations) > 0
         assert len(crisis.escalations) > 0
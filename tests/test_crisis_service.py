@@ -19,14 +19,17 @@ from app.schemas.crisis_management import (
 from app.repositories.contact_repository import ContactRepository
 from app.repositories.group_repository import GroupRepository
 
-from tests.fixtures.database_fixtures import test_session, clean_test_session
+from tests.fixtures.database_fixtures import (
+    session_test_engine, session_test_connection, session_test_session,
+    test_session, clean_test_session
+)
 from tests.fixtures.crisis_fixtures import (
-    sample_user, emergency_contacts, emergency_group,
+    sample_user, emergency_contacts, emergency_group, crisis_template,
     sample_crisis_activation, personnel_activations,
     confirmed_personnel_activation, declined_personnel_activation,
     escalated_personnel_activation, manual_escalation,
     mock_communication_services, create_crisis_activation_data,
-    crisis_test_data
+    crisis_test_data_fast
 )
 
 
@@ -264,10 +267,10 @@ class TestCrisisManagementService:
     def test_get_crisis_dashboard_data(
         self,
         crisis_service: CrisisManagementService,
-        crisis_test_data
+        crisis_test_data_fast
     ):
         """Test hämtning av dashboard-data"""
-        crisis = crisis_test_data["crisis"]
+        crisis = crisis_test_data_fast["crisis"]
         
         dashboard_data = crisis_service.get_crisis_dashboard_data(crisis.id)
         
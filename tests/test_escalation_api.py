@@ -0,0 +1,48 @@
+"""
+Tester för manuella eskaleringar via Crisis Management API
+"""
+import pytest
+
+from tests.fixtures.database_fixtures import (
+    session_test_engine, session_test_connection, session_test_session, test_session
+)
+from tests.fixtures.crisis_fixtures import (
+    sample_user, emergency_contacts, sample_crisis_activation, personnel_activations,
+    escalated_personnel_activation, manual_escalation
+)
+from tests.fixtures.crisis_api_data import chained_query
+
+
+class TestEscalationAPI:
+    """Tester för eskalering API endpoints"""
+    
+    @pytest.mark.parametrize("params", [
+        None,
+        {"operator_filter": "Telefonist Anna"},
+    ], ids=["unfiltered", "operator_filter"])
+    def test_get_pending_escalations(self, client, mock_crisis_service, params):
+        """Test hämtning av väntande eskaleringar med och utan operatörsfilter"""
+        mock_crisis_service.session.query.return_value = chained_query(all=[])
+        
+        response = client.get("/api/v1/crisis/escalations/pending", params=params)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data, list)
+    
+    def test_update_escalation(self, client, mock_crisis_service, manual_escalation):
+        """Test uppdatering av eskalering"""
+        mock_crisis_service.session.get.return_value = manual_escalation
+        
+        update_data = {
+            "contact_result": "confirmed",
+            "contact_notes": "Kontaktad via hemtelefon",
+            "contact_successful": True
+        }
+        
+        response = client.put(f"/api/v1/crisis/escalations/{manual_escalation.id}", json=update_data)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["contact_result"] == "confirmed"
+        assert data["contact_successful"] is True
@@ -4,7 +4,6 @@ Tests for the ManualReviewService class.
 import pytest
 import uuid
 from unittest.mock import Mock
-from sqlmodel import Session
 
 from app.services.manual_review_service import ManualReviewService
 from app.models import OutboxJob
@@ -13,11 +12,6 @@ from app.models import OutboxJob
 class TestManualReviewService:
     """Test suite for ManualReviewService."""
     
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        return Mock(spec=Session)
-    
     @pytest.fixture
     def manual_review_service(self, mock_session):
         """Create a ManualReviewService instance with a mock session."""
@@ -116,8 +110,6 @@ class TestManualReviewService:
         mock_job.status = "failed"
         mock_job.attempts = 3
         manual_review_service.jobs.get_by_id = Mock(return_value=mock_job)
-        manual_review_service.session.add = Mock()
-        manual_review_service.session.commit = Mock()
         
         # Test the method
         result = manual_review_service.requeue(job_id)
@@ -4,7 +4,6 @@ Tests for the OutreachService class.
 import pytest
 import uuid
 from unittest.mock import Mock, patch, AsyncMock
-from sqlmodel import Session
 from datetime import datetime
 
 from app.services.outreach_service import OutreachService
@@ -18,11 +17,6 @@ from app.repositories.outreach_repository import OutreachRepository
 class TestOutreachService:
     """Test suite for OutreachService."""
     
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        return Mock(spec=Session)
-    
     @pytest.fixture
     def mock_queue_publisher(self):
         """Create a mock queue publisher."""
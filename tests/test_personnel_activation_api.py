@@ -0,0 +1,50 @@
+"""
+Tester för personalaktivering via Crisis Management API
+"""
+import pytest
+
+from tests.fixtures.database_fixtures import (
+    session_test_engine, session_test_connection, session_test_session, test_session
+)
+from tests.fixtures.crisis_fixtures import (
+    sample_user, emergency_contacts, sample_crisis_activation, personnel_activations
+)
+from tests.fixtures.crisis_api_data import chained_query
+
+
+class TestPersonnelActivationAPI:
+    """Tester för personalaktivering API endpoints"""
+    
+    @pytest.mark.parametrize("params", [
+        None,
+        {"role_filter": "crisis_leader", "status_filter": "confirmed"},
+    ], ids=["unfiltered", "filtered"])
+    def test_get_crisis_personnel(self, client, mock_crisis_service, sample_crisis_activation, params):
+        """Test hämtning av krispersonal med och utan filter"""
+        # Mock service response
+        mock_crisis_service.session.get.return_value = sample_crisis_activation
+        mock_crisis_service.session.query.return_value = chained_query(all=[])
+        
+        response = client.get(f"/api/v1/crisis/{sample_crisis_activation.id}/personnel", params=params)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert "personnel_activations" in data
+        assert "total_count" in data
+        assert "confirmed_count" in data
+    
+    def test_update_personnel_activation(self, client, mock_crisis_service, personnel_activations):
+        """Test uppdatering av personalaktivering"""
+        activation = personnel_activations[0]
+        mock_crisis_service.session.get.return_value = activation
+        
+        update_data = {
+            "response_status": "confirmed",
+            "availability_comment": "Kan komma omgående"
+        }
+        
+        response = client.put(f"/api/v1/crisis/personnel/{activation.id}", json=update_data)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["response_status"] == "confirmed"
@@ -4,37 +4,48 @@ Tests for the SmsService class.
 import pytest
 import uuid
 from unittest.mock import Mock, patch
-from sqlmodel import Session
 from twilio.base.exceptions import TwilioRestException
 
 from app.services.sms_service import SmsService
+from app.repositories.sms_repository import SmsRepository
 from app.models import Message, Contact, PhoneNumber, SmsLog
-from tests.fixtures.twilio_mocks import MockTwilioClient, failing_twilio_client
+from tests.fixtures.twilio_mocks import failing_twilio_client
 
 
 class TestSmsService:
     """Test suite for SmsService."""
     
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        return Mock(spec=Session)
+    @pytest.fixture(scope="class", autouse=True)
+    def twilio_client_class(self):
+        """Keep SmsService from constructing a real Twilio client in any test."""
+        with patch('app.services.sms_service.Client') as client_class:
+            yield client_class
     
     @pytest.fixture
-    def mock_twilio_client(self):
-        """Create a mock Twilio client."""
-        return MockTwilioClient()
+    def mock_repository(self, sample_contact, sample_phone_numbers):
+        """Create an SMS repository mock pre-wired for the happy path."""
+        mock_message = Mock(spec=Message)
+        mock_message.name = "Test Message"
+        mock_message.message_type = "sms"
+        repository = Mock(spec=SmsRepository)
+        repository.get_message_by_id.return_value = mock_message
+        repository.get_contacts_by_ids.return_value = [sample_contact]
+        repository.get_contacts_by_group_id.return_value = [sample_contact]
+        repository.get_phone_for_contact.return_value = (sample_phone_numbers, [])
+        repository.create_sms_log.return_value = Mock(spec=SmsLog)
+        return repository
     
     @pytest.fixture
-    def sms_service(self, mock_session, mock_twilio_client):
+    def sms_service(self, mock_session, mock_twilio_client, mock_repository):
         """Create an SmsService instance with mock dependencies."""
         service = SmsService(mock_session)
         service.twilio_client = mock_twilio_client
+        service.repository = mock_repository
         return service
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_contact(self, sample_phone_numbers):
-        """Create a sample contact for testing."""
+        """Create a read-only sample contact shared by the tests in this class."""
         contact = Contact(
             id=uuid.uuid4(),
             name="Test Contact",
@@ -44,20 +55,20 @@ class TestSmsService:
         contact.phone_numbers = sample_phone_numbers
         return contact
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_phone_numbers(self):
-        """Create sample phone numbers for testing."""
+        """Create read-only sample phone numbers shared by the tests in this class."""
         return [
             PhoneNumber(id=uuid.uuid4(), contact_id=uuid.uuid4(), number="+1234567890", priority=1),
             PhoneNumber(id=uuid.uuid4(), contact_id=uuid.uuid4(), number="+0987654321", priority=2)
         ]
     
-    def test_init(self, mock_session):
+    def test_init(self, mock_session, twilio_client_class):
         """Test SmsService initialization."""
         service = SmsService(mock_session)
         assert service.session == mock_session
         assert service.repository is not None
-        assert service.twilio_client is not None
+        assert service.twilio_client is twilio_client_class.return_value
     
     def test_send_sms_success(self, sms_service):
         """Test successful SMS sending."""
@@ -89,17 +100,11 @@ class TestSmsService:
         # Assertions
         sms_service.twilio_client.messages.create.assert_called_once()
     
-    async def test_send_message_to_contacts_success(self, sms_service, sample_contact, sample_phone_numbers):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_send_message_to_contacts_success(self, sms_service):
         """Test successful SMS sending to contacts."""
         # Setup mocks
-        mock_message = Mock(spec=Message)
-        mock_message.name = "Test Message"
-        mock_message.message_type = "sms"
-        sms_service.repository.get_message_by_id = Mock(return_value=mock_message)
-        sms_service.repository.get_contacts_by_ids = Mock(return_value=[sample_contact])
-        sms_service.repository.get_contact_phone_numbers = Mock(return_value=sample_phone_numbers)
         sms_service.send_sms = Mock(return_value="SM1234567890")
-        sms_service.repository.create_sms_log = Mock(return_value=Mock(spec=SmsLog))
     
         # Test the method
         result = await sms_service.send_message_to_contacts(
@@ -112,20 +117,12 @@ class TestSmsService:
         assert result["failed_count"] == 0
         sms_service.send_sms.assert_called_once()
     
-    async def test_send_message_to_contacts_failure(self, sms_service, sample_contact, sample_phone_numbers):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_send_message_to_contacts_failure(self, sms_service):
         """Test SMS sending failure to contacts."""
-        # Setup mocks
-        mock_message = Mock(spec=Message)
-        mock_message.name = "Test Message"
-        mock_message.message_type = "sms"
-        sms_service.repository.get_message_by_id = Mock(return_value=mock_message)
-        sms_service.repository.get_contacts_by_ids = Mock(return_value=[sample_contact])
-        sms_service.repository.get_contact_phone_numbers = Mock(return_value=sample_phone_numbers)
-        
         # Simulate failure in send_sms by raising TwilioRestException
         from twilio.base.exceptions import TwilioRestException
         sms_service.send_sms = Mock(side_effect=TwilioRestException(400, "Test error"))
-        sms_service.repository.create_sms_log = Mock(return_value=Mock(spec=SmsLog))
     
         # Test the method
         result = await sms_service.send_message_to_contacts(
@@ -139,17 +136,11 @@ class TestSmsService:
         # send_sms should be called for each phone number (2 times in this case)
         assert sms_service.send_sms.call_count == 2
     
-    async def test_send_message_to_group_success(self, sms_service, sample_contact, sample_phone_numbers):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_send_message_to_group_success(self, sms_service):
         """Test successful SMS sending to a group."""
         # Setup mocks
-        mock_message = Mock(spec=Message)
-        mock_message.name = "Test Message"
-        mock_message.message_type = "sms"
-        sms_service.repository.get_message_by_id = Mock(return_value=mock_message)
-        sms_service.repository.get_contacts_by_group_id = Mock(return_value=[sample_contact])
-        sms_service.repository.get_contact_phone_numbers = Mock(return_value=sample_phone_numbers)
         sms_service.send_sms = Mock(return_value="SM1234567890")
-        sms_service.repository.create_sms_log = Mock(return_value=Mock(spec=SmsLog))
     
         # Test the method
         result = await sms_service.send_message_to_contacts(